@@ -0,0 +1,234 @@
+"""
+Measures the overhead of the client against the local stand-in API from
+server.py: requests per second, p50/p99 latency, memory the client still
+holds per operation after the measured loop and model construction cost.
+
+    python benchmarks/client.py [--operations N] [--concurrency C] [--latency S]
+                                [--error-rate R] [--json] [--output FILE]
+                                [--baseline FILE] [--tolerance T]
+
+With --baseline the run exits with status 1 when a scenario's throughput
+dropped, or its p99 latency grew, by more than the tolerance.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import models  # noqa: E402
+import server  # noqa: E402
+
+from roblox import RateLimiter, Roblox  # noqa: E402
+from roblox.errors import RobloxException  # noqa: E402
+
+
+async def get_user(client, index):
+    await client.get_user(index + 1)
+
+
+async def get_gamepass(client, index):
+    await client.get_gamepass(index + 1)
+
+
+async def has_user(client, index):
+    gamepass = await client.get_gamepass(1)
+    await gamepass.has_user(index + 1)
+
+
+async def purchase(client, index):
+    gamepass = await client.get_gamepass(index + 1)
+    await gamepass.purchase()
+
+
+SCENARIOS = {
+    'get_user': get_user,
+    'get_gamepass': get_gamepass,
+    'has_user': has_user,
+    'purchase': purchase,
+}
+
+
+def percentile(samples, quantile):
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, round(quantile * (len(ordered) - 1)))]
+
+
+def make_client(args):
+    return Roblox(
+        authorization='benchmark',
+        base_urls={module: f'{args.url}/{module}' for module in server.MODULES},
+        ratelimiter=RateLimiter(backoff_base=args.backoff_base, backoff_max=args.backoff_base * 8),
+        prefetch_csrf_token=True,
+    )
+
+
+async def run_scenario(args, scenario, operations, trace=False):
+    latencies = []
+    errors = 0
+    indexes = iter(range(operations))
+    snapshots = []
+
+    async with make_client(args) as client:
+        await client.start(warm_up=True)
+
+        async def worker():
+            nonlocal errors
+            for index in indexes:
+                start = time.perf_counter()
+                try:
+                    await scenario(client, index)
+                except RobloxException:
+                    errors += 1
+                latencies.append(time.perf_counter() - start)
+
+        if trace:
+            snapshots.append(tracemalloc.take_snapshot())
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+        elapsed = time.perf_counter() - start
+        if trace:
+            snapshots.append(tracemalloc.take_snapshot())
+
+    return elapsed, latencies, errors, snapshots
+
+
+# only count what the client allocates; the stand-in server and aiohttp's own buffers share this process
+CLIENT_FILTERS = [tracemalloc.Filter(True, str(Path(__file__).resolve().parent.parent / 'roblox' / '*'))]
+
+
+async def measure_allocations(args, scenario, operations):
+    tracemalloc.start()
+    try:
+        _, _, _, (before, after) = await run_scenario(args, scenario, operations, trace=True)
+    finally:
+        tracemalloc.stop()
+
+    before = before.filter_traces(CLIENT_FILTERS)
+    after = after.filter_traces(CLIENT_FILTERS)
+    stats = after.compare_to(before, 'lineno')
+
+    allocated = sum(stat.size_diff for stat in stats if stat.size_diff > 0)
+    count = sum(stat.count_diff for stat in stats if stat.count_diff > 0)
+    return allocated / operations, count / operations
+
+
+async def run(args):
+    mock, runner, url = await server.start(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        ratelimit_rate=args.ratelimit_rate,
+    )
+
+    args.url = url
+
+    results = []
+    try:
+        for name, scenario in SCENARIOS.items():
+            if args.scenario and name not in args.scenario:
+                continue
+
+            elapsed, latencies, errors, _ = await run_scenario(args, scenario, args.operations)
+            allocated, allocations = await measure_allocations(args, scenario, min(args.operations, 200))
+
+            results.append(
+                {
+                    'scenario': name,
+                    'operations': args.operations,
+                    'concurrency': args.concurrency,
+                    'errors': errors,
+                    'rps': args.operations / elapsed,
+                    'p50_ms': percentile(latencies, 0.5) * 1000,
+                    'p99_ms': percentile(latencies, 0.99) * 1000,
+                    'retained_bytes_per_op': allocated,
+                    'retained_blocks_per_op': allocations,
+                    'server_requests': mock.requests,
+                }
+            )
+            mock.requests = 0
+    finally:
+        await runner.cleanup()
+
+    for model, (template, classes) in models.MODELS.items():
+        construct, _ = models.bench_construct(models.factories(classes)['eager'], template, 10_000)
+        results.append({'scenario': f'construct_{model}', 'construct_ns': construct / 10_000 * 1e9})
+
+    return results
+
+
+def compare(results, baseline, tolerance):
+    previous = {result['scenario']: result for result in baseline}
+    regressions = []
+
+    for result in results:
+        before = previous.get(result['scenario'])
+        if before is None:
+            continue
+
+        if 'rps' in result and result['rps'] < before['rps'] * (1 - tolerance):
+            regressions.append(f'{result["scenario"]}: rps {before["rps"]:.0f} -> {result["rps"]:.0f}')
+
+        if 'p99_ms' in result and result['p99_ms'] > before['p99_ms'] * (1 + tolerance):
+            regressions.append(f'{result["scenario"]}: p99 {before["p99_ms"]:.2f}ms -> {result["p99_ms"]:.2f}ms')
+
+        if 'construct_ns' in result and result['construct_ns'] > before['construct_ns'] * (1 + tolerance):
+            regressions.append(
+                f'{result["scenario"]}: {before["construct_ns"]:.0f}ns -> {result["construct_ns"]:.0f}ns'
+            )
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--operations', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--scenario', action='append', choices=list(SCENARIOS), help='only run these scenarios')
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds the server waits before answering')
+    parser.add_argument('--jitter', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of requests answered with 500')
+    parser.add_argument('--ratelimit-rate', type=float, default=0.0, help='fraction of requests answered with 429')
+    parser.add_argument('--backoff-base', type=float, default=0.01)
+    parser.add_argument('--json', action='store_true', help='print machine readable results')
+    parser.add_argument('--output', type=Path, help='also write the JSON results to this file')
+    parser.add_argument('--baseline', type=Path, help='JSON results of an earlier run to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.2)
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f'{"scenario":<26}{"rps":>10}{"p50 ms":>10}{"p99 ms":>10}{"bytes/op":>12}{"blocks/op":>10}{"errors":>8}')
+        for result in results:
+            if 'rps' in result:
+                print(
+                    f'{result["scenario"]:<26}{result["rps"]:>10.0f}{result["p50_ms"]:>10.2f}{result["p99_ms"]:>10.2f}'
+                    f'{result["retained_bytes_per_op"]:>12.0f}{result["retained_blocks_per_op"]:>10.1f}{result["errors"]:>8}'
+                )
+            else:
+                print(f'{result["scenario"]:<26}{result["construct_ns"]:>10.0f} ns/object')
+
+    if args.baseline:
+        regressions = compare(results, json.loads(args.baseline.read_text()), args.tolerance)
+        for regression in regressions:
+            print(f'regression: {regression}', file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
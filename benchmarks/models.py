@@ -0,0 +1,163 @@
+"""
+Compares construction cost, attribute access and resident memory of the eager,
+lazy and payload-discarding model classes.
+
+    python benchmarks/models.py [--count N] [--json]
+"""
+
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from roblox.gamepass import Gamepass, LazyGamepass, LazyPartialGamepass, PartialGamepass  # noqa: E402
+from roblox.user import LazyUser, User  # noqa: E402
+
+USER = {
+    'description': 'Lorem ipsum dolor sit amet, consectetur adipiscing elit. ' * 4,
+    'created': '2016-03-22T18:21:35.637Z',
+    'isBanned': False,
+    'externalAppDisplayName': None,
+    'hasVerifiedBadge': False,
+    'id': 1,
+    'name': 'Builderman',
+    'displayName': 'Builderman',
+}
+
+GAMEPASS = {
+    'TargetId': 1,
+    'ProductType': 'Game Pass',
+    'AssetId': 0,
+    'ProductId': 1000,
+    'Name': 'VIP',
+    'Description': 'Lorem ipsum dolor sit amet, consectetur adipiscing elit. ' * 4,
+    'AssetTypeId': 0,
+    'Creator': {'Id': 1, 'Name': 'Builderman', 'CreatorType': 'User', 'CreatorTargetId': 1},
+    'IconImageAssetId': 123456,
+    'Created': '2019-01-01T00:00:00.000Z',
+    'Updated': '2024-05-17T12:30:00.000Z',
+    'PriceInRobux': 100,
+    'PriceInTickets': None,
+    'Sales': 0,
+    'IsNew': False,
+    'IsForSale': True,
+    'IsPublicDomain': False,
+    'IsLimited': False,
+    'IsLimitedUnique': False,
+    'Remaining': None,
+    'MinimumMembershipLevel': 0,
+}
+
+PARTIAL_GAMEPASS = {
+    'gamePassId': 1,
+    'iconAssetId': 123456,
+    'name': 'VIP',
+    'description': 'Lorem ipsum dolor sit amet, consectetur adipiscing elit. ' * 4,
+    'isForSale': True,
+    'price': 100,
+    'creator': {'Id': 1, 'Name': 'Builderman', 'CreatorType': 'User', 'CreatorTargetId': 1},
+}
+
+MODELS = {
+    'user': (USER, {'eager': User, 'lazy': LazyUser}),
+    'gamepass': (GAMEPASS, {'eager': Gamepass, 'lazy': LazyGamepass}),
+    'partial_gamepass': (PARTIAL_GAMEPASS, {'eager': PartialGamepass, 'lazy': LazyPartialGamepass}),
+}
+
+
+def factories(classes):
+    eager, lazy = classes['eager'], classes['lazy']
+
+    return {
+        'eager': lambda data: eager(None, data),
+        'lazy': lambda data: lazy(None, data),
+        'discard': lambda data: eager(None, data, retain_payload=False),
+    }
+
+
+def payloads(template, count):
+    # decode every payload separately so no strings are shared between them, like with real responses
+    raw = json.dumps(template).encode()
+    return [json.loads(raw) for _ in range(count)]
+
+
+def bench_construct(factory, template, count):
+    data = payloads(template, count)
+
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        objects = [factory(payload) for payload in data]
+        elapsed = time.perf_counter() - start
+    finally:
+        gc.enable()
+
+    return elapsed, objects
+
+
+def bench_access(objects):
+    start = time.perf_counter()
+    for obj in objects:
+        obj.id
+        obj.name
+    return time.perf_counter() - start
+
+
+def bench_memory(factory, template, count):
+    gc.collect()
+    tracemalloc.start()
+
+    objects = [factory(payload) for payload in payloads(template, count)]
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+
+    tracemalloc.stop()
+    del objects
+
+    return current
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--count', type=int, default=100_000)
+    parser.add_argument('--json', action='store_true', help='print machine readable results')
+    args = parser.parse_args()
+
+    results = []
+    for model, (template, classes) in MODELS.items():
+        for mode, factory in factories(classes).items():
+            construct, objects = bench_construct(factory, template, args.count)
+            access = bench_access(objects)
+            del objects
+            memory = bench_memory(factory, template, args.count)
+
+            results.append(
+                {
+                    'model': model,
+                    'mode': mode,
+                    'count': args.count,
+                    'construct_ns': construct / args.count * 1e9,
+                    'access_ns': access / args.count * 1e9,
+                    'bytes_per_object': memory / args.count,
+                }
+            )
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f'{"model":<18}{"mode":<10}{"construct ns":>14}{"access ns":>12}{"bytes/object":>14}')
+    for result in results:
+        print(
+            f'{result["model"]:<18}{result["mode"]:<10}{result["construct_ns"]:>14.0f}'
+            f'{result["access_ns"]:>12.0f}{result["bytes_per_object"]:>14.0f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,210 @@
+"""
+A local stand-in for the users, apis, inventory and auth endpoints used by the
+client, serving canned payloads shaped like roblox/types.
+
+Every module is mounted under its own path prefix, so one server covers all of
+them:
+
+    Roblox(base_urls={'users': 'http://127.0.0.1:8080/users', ...})
+
+Run it on its own with ``python benchmarks/server.py --port 8080``.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+
+from aiohttp import web
+
+CSRF_TOKEN = 'benchmark-token'
+MODULES = ('users', 'apis', 'inventory', 'auth')
+
+
+def user_payload(user_id):
+    return {
+        'description': 'Lorem ipsum dolor sit amet, consectetur adipiscing elit.',
+        'created': '2016-03-22T18:21:35.637Z',
+        'isBanned': False,
+        'externalAppDisplayName': None,
+        'hasVerifiedBadge': False,
+        'id': user_id,
+        'name': f'User{user_id}',
+        'displayName': f'User{user_id}',
+    }
+
+
+def gamepass_payload(gamepass_id):
+    return {
+        'TargetId': gamepass_id,
+        'ProductType': 'Game Pass',
+        'AssetId': 0,
+        'ProductId': gamepass_id,
+        'Name': f'Gamepass {gamepass_id}',
+        'Description': 'Lorem ipsum dolor sit amet, consectetur adipiscing elit.',
+        'AssetTypeId': 0,
+        'Creator': {'Id': 1, 'Name': 'User1', 'CreatorType': 'User', 'CreatorTargetId': 1},
+        'IconImageAssetId': 0,
+        'Created': '2019-01-01T00:00:00.000Z',
+        'Updated': '2024-05-17T12:30:00.000Z',
+        'PriceInRobux': 100,
+        'PriceInTickets': None,
+        'Sales': 0,
+        'IsNew': False,
+        'IsForSale': True,
+        'IsPublicDomain': False,
+        'IsLimited': False,
+        'IsLimitedUnique': False,
+        'Remaining': None,
+        'MinimumMembershipLevel': 0,
+    }
+
+
+def partial_gamepass_payload(gamepass_id):
+    return {
+        'gamePassId': gamepass_id,
+        'iconAssetId': 0,
+        'name': f'Gamepass {gamepass_id}',
+        'description': 'Lorem ipsum dolor sit amet, consectetur adipiscing elit.',
+        'isForSale': True,
+        'price': 100,
+        'creator': {'Id': 1, 'Name': 'User1', 'CreatorType': 'User', 'CreatorTargetId': 1},
+    }
+
+
+class MockRoblox:
+
+    def __init__(self, *, latency=0.0, jitter=0.0, error_rate=0.0, ratelimit_rate=0.0, gamepasses_per_user=250):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.ratelimit_rate = ratelimit_rate
+        self.gamepasses_per_user = gamepasses_per_user
+
+        self.requests = 0
+
+    def application(self):
+        app = web.Application(middlewares=[self.inject])
+        routes = [
+            ('POST', '/users/v1/usernames/users', self.users_by_name),
+            ('POST', '/users/v1/users', self.users_by_id),
+            ('GET', '/users/v1/users/authenticated', self.authenticated_user),
+            ('GET', '/users/v1/users/{user_id}', self.user),
+            ('GET', '/apis/game-passes/v1/game-passes/{gamepass_id}/product-info', self.gamepass),
+            ('GET', '/apis/game-passes/v1/users/{user_id}/game-passes', self.user_gamepasses),
+            ('POST', '/apis/game-passes/v1/game-passes/{product_id}/purchase', self.purchase),
+            ('POST', '/apis/game-passes/v1/game-passes/{gamepass_id}:revokeownership', self.revoke),
+            ('GET', '/inventory/v1/users/{user_id}/items/GamePass/{gamepass_id}', self.ownership),
+            ('POST', '/auth/v2/logout', self.logout),
+        ]
+        for method, path, handler in routes:
+            app.router.add_route(method, path, handler)
+
+        return app
+
+    @web.middleware
+    async def inject(self, request, handler):
+        self.requests += 1
+
+        delay = self.latency + random.uniform(0, self.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+
+        if self.ratelimit_rate and random.random() < self.ratelimit_rate:
+            return web.json_response({'errors': [{'code': 0, 'message': 'Too many requests'}]}, status=429)
+
+        if self.error_rate and random.random() < self.error_rate:
+            return web.json_response({'errors': [{'code': 0, 'message': 'InternalServerError'}]}, status=500)
+
+        if request.method == 'POST' and request.path.startswith('/apis/'):
+            if request.headers.get('X-CSRF-TOKEN') != CSRF_TOKEN:
+                return self.csrf_failure()
+
+        return await handler(request)
+
+    def csrf_failure(self):
+        return web.json_response(
+            {'errors': [{'code': 0, 'message': 'Token Validation Failed'}]},
+            status=403,
+            headers={'x-csrf-token': CSRF_TOKEN},
+        )
+
+    async def users_by_name(self, request):
+        names = (await request.json())['usernames']
+        data = [
+            dict(user_payload(int(name[4:])), requestedUsername=name)
+            for name in names
+            if name.lower().startswith('user') and name[4:].isdigit()
+        ]
+        return web.json_response({'data': data})
+
+    async def users_by_id(self, request):
+        ids = (await request.json())['userIds']
+        keys = ('hasVerifiedBadge', 'id', 'name', 'displayName')
+        return web.json_response({'data': [{key: user_payload(i)[key] for key in keys} for i in ids]})
+
+    async def authenticated_user(self, request):
+        return web.json_response({'id': 1, 'name': 'User1', 'displayName': 'User1'})
+
+    async def user(self, request):
+        return web.json_response(user_payload(int(request.match_info['user_id'])))
+
+    async def gamepass(self, request):
+        return web.json_response(gamepass_payload(int(request.match_info['gamepass_id'])))
+
+    async def user_gamepasses(self, request):
+        count = int(request.query.get('count', 100))
+        start = int(request.query.get('exclusiveStartId', 0))
+        end = min(start + count, self.gamepasses_per_user)
+        return web.json_response({'gamePasses': [partial_gamepass_payload(i) for i in range(start + 1, end + 1)]})
+
+    async def purchase(self, request):
+        return web.json_response({'purchased': True, 'reason': 'Success'})
+
+    async def revoke(self, request):
+        return web.Response(text='')
+
+    async def ownership(self, request):
+        user_id, gamepass_id = int(request.match_info['user_id']), int(request.match_info['gamepass_id'])
+        owned = (user_id + gamepass_id) % 2 == 0
+        return web.json_response({'previousPageCursor': None, 'nextPageCursor': None, 'data': [{}] if owned else []})
+
+    async def logout(self, request):
+        return self.csrf_failure()
+
+
+async def start(host='127.0.0.1', port=0, **options):
+    mock = MockRoblox(**options)
+    runner = web.AppRunner(mock.application(), access_log=None)
+    await runner.setup()
+
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+
+    # port 0 lets the OS pick a free one
+    bound_port = runner.addresses[0][1]
+    return mock, runner, f'http://{host}:{bound_port}'
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds added to every response')
+    parser.add_argument('--jitter', type=float, default=0.0, help='random extra latency, in seconds')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of requests answered with 500')
+    parser.add_argument('--ratelimit-rate', type=float, default=0.0, help='fraction of requests answered with 429')
+    args = parser.parse_args()
+
+    mock = MockRoblox(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        ratelimit_rate=args.ratelimit_rate,
+    )
+    print(json.dumps({'modules': {module: f'http://{args.host}:{args.port}/{module}' for module in MODULES}}))
+    web.run_app(mock.application(), host=args.host, port=args.port, access_log=None, print=None)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+"""
+Compares a sort followed by a few date range filters over gamepasses when the
+timestamp is parsed on every access, parsed once per model, and converted in
+one pass to an int64 array with utils.timestamps.
+
+    python benchmarks/timestamps.py [--count N] [--json]
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from roblox import utils  # noqa: E402
+from roblox.gamepass import Gamepass  # noqa: E402
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from models import GAMEPASS  # noqa: E402
+
+
+def make_gamepasses(count):
+    start = datetime(2010, 1, 1, tzinfo=timezone.utc)
+    gamepasses = []
+
+    for index in range(count):
+        created = start + timedelta(seconds=random.randrange(500_000_000), milliseconds=random.randrange(1000))
+        payload = dict(GAMEPASS, TargetId=index, Created=created.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z')
+        gamepasses.append(Gamepass(None, payload))  # type: ignore
+
+    return gamepasses
+
+
+FILTERS = 5
+CUTOFF = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+
+def parse(gamepass):
+    # what every access of Gamepass.created used to cost
+    return datetime.fromisoformat(gamepass.raw_created.replace('Z', '+00:00'))
+
+
+def per_access(gamepasses):
+    ordered = sorted(gamepasses, key=parse)
+    for _ in range(FILTERS):
+        [gamepass for gamepass in gamepasses if parse(gamepass) >= CUTOFF]
+    return ordered
+
+
+def memoized(gamepasses):
+    ordered = sorted(gamepasses, key=lambda gamepass: gamepass.created)
+    for _ in range(FILTERS):
+        [gamepass for gamepass in gamepasses if gamepass.created >= CUTOFF]
+    return ordered
+
+
+def batched(gamepasses):
+    created = utils.timestamps(gamepasses)
+    cutoff = int(CUTOFF.timestamp()) * 1_000_000
+
+    ordered = [gamepasses[index] for index in sorted(range(len(created)), key=created.__getitem__)]
+    for _ in range(FILTERS):
+        [gamepasses[index] for index, value in enumerate(created) if value >= cutoff]
+    return ordered
+
+
+def timed(function, count, repeat):
+    best = float('inf')
+
+    for _ in range(repeat):
+        gamepasses = make_gamepasses(count)
+
+        start = time.perf_counter()
+        function(gamepasses)
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--count', type=int, default=100_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--json', action='store_true', help='print machine readable results')
+    args = parser.parse_args()
+
+    gamepasses = make_gamepasses(1000)
+    assert [g.id for g in per_access(gamepasses)] == [g.id for g in batched(gamepasses)]
+    assert [g.id for g in per_access(gamepasses)] == [g.id for g in utils.sort_by_time(gamepasses)]
+
+    results = [
+        {'strategy': name, 'count': args.count, 'seconds': timed(function, args.count, args.repeat)}
+        for name, function in (('per_access', per_access), ('memoized', memoized), ('batched', batched))
+    ]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f'{"strategy":<12}{"seconds":>10}')
+    for result in results:
+        print(f'{result["strategy"]:<12}{result["seconds"]:>10.4f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,5 @@
 import asyncio
 import os
-from time import sleep
 
 import dotenv
 
@@ -31,14 +30,12 @@ async def main():
 
         if client_user_owns_gamepass:
             print('Removing from inventory: ', gamepass.name)
-            await gamepass.revoke()
-
-            print('Pass removed, waiting for pending transaction')
-            sleep(61)
+            await client.queue_revoke(gamepass)
 
+        # retried in the background while the revoke is still a pending transaction
         print('Purchasing: ', gamepass.name)
         try:
-            await gamepass.purchase()
+            await client.queue_purchase(gamepass)
         except errors.NotEnoughFunds:
             print('Not enough balance')
 
@@ -0,0 +1,19 @@
+from roblox import Sweep
+
+
+def main():
+    # stop it at any time, running it again picks up after the last finished shard
+    sweep = Sweep(
+        range(1, 100_001),
+        kind='user',
+        output='users.ndjson',
+        checkpoint='users.checkpoint',
+        shard_size=500,
+        rate=50,
+    )
+
+    print(sweep.run())
+
+
+if __name__ == '__main__':
+    main()
@@ -10,22 +10,44 @@ __copyright__ = 'Copyright 2015-present Gwarded'
 __version__ = '1.0.0a'
 
 
-from . import abc as abc
+from . import abc as abc, utils as utils
+from .cache import Cache, DiskCache, TTLCache
+from .cassette import RecordingTransport, ReplayTransport
 from .client import Roblox
 from .errors import (
     Forbidden,
     InternalServerError,
     NotFound,
     PendingTransactionAlreadyExists,
+    TooManyRequests,
     Unauthorized,
     UnknownStatus,
     WrongDataPassed,
 )
 from .gamepass import Gamepass, PartialGamepass
+from .instrumentation import (
+    InFlightGauge,
+    LatencyCollector,
+    PrometheusObserver,
+    RequestObserver,
+    ResponseSizeCollector,
+    StatusCollector,
+)
+from .ownership import OwnershipDiff, OwnershipIndex
+from .pool import PoolAccount, RobloxPool
+from .purchases import PurchaseQueue
+from .ratelimit import RateLimiter, TokenBucket
+from .sweep import RateCoordinator, Sweep
+from .transport import AiohttpTransport, Response, Transport, TransportConfig
 from .user import PartialUser, User
 
 __all__ = (
     'Roblox',
+    'RobloxPool',
+    'PoolAccount',
+    'Cache',
+    'TTLCache',
+    'DiskCache',
     'Unauthorized',
     'NotFound',
     'UnknownStatus',
@@ -37,4 +59,24 @@ __all__ = (
     'PartialGamepass',
     'Forbidden',
     'PendingTransactionAlreadyExists',
+    'TooManyRequests',
+    'PurchaseQueue',
+    'OwnershipIndex',
+    'OwnershipDiff',
+    'RateLimiter',
+    'TokenBucket',
+    'Sweep',
+    'RateCoordinator',
+    'TransportConfig',
+    'Transport',
+    'AiohttpTransport',
+    'Response',
+    'RecordingTransport',
+    'ReplayTransport',
+    'RequestObserver',
+    'LatencyCollector',
+    'InFlightGauge',
+    'ResponseSizeCollector',
+    'StatusCollector',
+    'PrometheusObserver',
 )
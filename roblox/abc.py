@@ -25,7 +25,7 @@ SOFTWARE.
 from __future__ import annotations
 
 from datetime import datetime
-from typing import TYPE_CHECKING, Literal, Optional, Protocol, Union, overload, runtime_checkable
+from typing import TYPE_CHECKING, Dict, Iterable, Literal, Optional, Protocol, Union, overload, runtime_checkable
 
 if TYPE_CHECKING:
     from roblox.types import CreatorType
@@ -130,3 +130,11 @@ class Gamepass(Object, Protocol):
 
     async def has_user(self, target: Union[User, PartialUser, int]) -> bool:
         raise NotImplementedError
+
+    async def has_users(
+        self,
+        targets: Iterable[Union[User, PartialUser, int]],
+        *,
+        concurrency: int = ...,
+    ) -> Dict[int, Union[bool, BaseException]]:
+        raise NotImplementedError
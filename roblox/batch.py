@@ -0,0 +1,104 @@
+"""
+MIT License
+
+Copyright (c) 2025 Gwarded
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, List, Optional, Set, TypeVar
+
+__all__ = ('Batcher',)
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+
+class Batcher(Generic[K, V]):
+    __slots__ = (
+        'fetch',
+        'max_size',
+        'delay',
+        '_pending',
+        '_handle',
+        '_tasks',
+    )
+
+    def __init__(self, fetch: Callable[[List[K]], Awaitable[Dict[K, V]]], *, max_size: int, delay: float = 0.005):
+        self.fetch = fetch
+        self.max_size = max_size
+        self.delay = delay
+
+        self._pending: Dict[K, asyncio.Future[Optional[V]]] = {}
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task[None]] = set()
+
+    async def get(self, key: K) -> Optional[V]:
+        future = self._pending.get(key)
+
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[key] = future
+
+            if len(self._pending) >= self.max_size:
+                self.flush()
+            elif self._handle is None:
+                self._handle = loop.call_later(self.delay, self.flush)
+
+        # shield so that one cancelled waiter doesn't cancel the lookup for everyone sharing it
+        return await asyncio.shield(future)
+
+    def flush(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, {}
+
+        task = asyncio.get_running_loop().create_task(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: Dict[K, asyncio.Future[Optional[V]]]) -> None:
+        try:
+            results = await self.fetch(list(batch))
+        except asyncio.CancelledError:
+            for future in batch.values():
+                future.cancel()
+            raise
+        except BaseException as exc:
+            # library errors derive from BaseException, so they have to be caught here as well
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(exc)
+
+            if isinstance(exc, (KeyboardInterrupt, SystemExit)):
+                raise
+            return
+
+        for key, future in batch.items():
+            if not future.done():
+                future.set_result(results.get(key))
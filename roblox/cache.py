@@ -0,0 +1,310 @@
+"""
+MIT License
+
+Copyright (c) 2025 Gwarded
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Generic, Hashable, Iterator, NamedTuple, Optional, Tuple, TypeVar, Union
+
+__all__ = ('TTLCache', 'DiskCache', 'StoredEntry', 'Cache')
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+T = TypeVar('T')
+
+
+class TTLCache(Generic[K, V]):
+    __slots__ = (
+        'ttl',
+        'maxsize',
+        'hits',
+        'misses',
+        'evictions',
+        '_data',
+    )
+
+    def __init__(self, *, ttl: Optional[float] = None, maxsize: Optional[int] = None):
+        self.ttl = ttl
+        self.maxsize = maxsize
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+        # key -> (expires at, value), ordered from least to most recently used
+        self._data: OrderedDict[K, Tuple[float, V]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: K) -> bool:
+        entry = self._data.get(key)
+        return entry is not None and entry[0] > time.monotonic()
+
+    def get(self, key: K) -> Optional[V]:
+        entry = self._data.get(key)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires, value = entry
+
+        if expires <= time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            return None
+
+        self._data.move_to_end(key)
+        self.hits += 1
+
+        return value
+
+    def set(self, key: K, value: V, *, ttl: Optional[float] = None) -> None:
+        if ttl is None:
+            ttl = self.ttl
+
+        expires = time.monotonic() + ttl if ttl is not None else float('inf')
+
+        self._data[key] = (expires, value)
+        self._data.move_to_end(key)
+
+        if self.maxsize is not None:
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: K) -> bool:
+        return self._data.pop(key, None) is not None
+
+    def invalidate_where(self, predicate: Callable[[K], bool]) -> int:
+        keys = [key for key in self._data if predicate(key)]
+
+        for key in keys:
+            del self._data[key]
+
+        return len(keys)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'size': len(self._data),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+
+class StoredEntry(NamedTuple):
+    payload: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.fetched_at
+
+    def validators(self) -> Optional[Dict[str, str]]:
+        headers = {}
+
+        if self.etag is not None:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified is not None:
+            headers['If-Modified-Since'] = self.last_modified
+
+        return headers or None
+
+
+class DiskCache:
+    __slots__ = ('path', 'max_age', 'hits', 'misses', 'revalidated', '_db', '_executor')
+
+    def __init__(self, path: Union[str, Path], *, max_age: Optional[float] = 7 * 24 * 60 * 60):
+        self.path = Path(path)
+        # entries older than this are neither served nor revalidated
+        self.max_age = max_age
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.revalidated: int = 0
+
+        self._db: Optional[sqlite3.Connection] = None
+        # sqlite calls block, async callers go through this single thread so queries stay serialized
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def db(self) -> sqlite3.Connection:
+        if self._db is None:
+            # autocommit, every write is a single statement
+            db = self._db = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+            db.execute('PRAGMA journal_mode=WAL')
+            db.execute('PRAGMA synchronous=NORMAL')
+            db.execute(
+                'CREATE TABLE IF NOT EXISTS entries ('
+                'kind TEXT NOT NULL, id INTEGER NOT NULL, payload BLOB NOT NULL, '
+                'etag TEXT, last_modified TEXT, fetched_at REAL NOT NULL, PRIMARY KEY (kind, id))'
+            )
+
+        return self._db
+
+    def __len__(self) -> int:
+        return self.db.execute('SELECT COUNT(*) FROM entries').fetchone()[0]
+
+    def run(self, func: Callable[..., T], *args: Any) -> asyncio.Future[T]:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(1, thread_name_prefix='roblox-disk-cache')
+
+        return asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def _oldest(self) -> float:
+        return time.time() - self.max_age if self.max_age is not None else 0.0
+
+    def get(self, kind: str, id: int) -> Optional[StoredEntry]:
+        row = self.db.execute(
+            'SELECT payload, etag, last_modified, fetched_at FROM entries WHERE kind = ? AND id = ? AND fetched_at >= ?',
+            (kind, id, self._oldest()),
+        ).fetchone()
+
+        if row is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return StoredEntry(*row)
+
+    def set(
+        self,
+        kind: str,
+        id: int,
+        payload: bytes,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        self.db.execute(
+            'INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)',
+            (kind, id, payload, etag, last_modified, time.time()),
+        )
+
+    def touch(self, kind: str, id: int) -> None:
+        # the server confirmed the stored payload is still current
+        self.db.execute('UPDATE entries SET fetched_at = ? WHERE kind = ? AND id = ?', (time.time(), kind, id))
+        self.revalidated += 1
+
+    def entries(
+        self,
+        kind: str,
+        *,
+        newer_than: float = 0.0,
+        limit: Optional[int] = None,
+    ) -> Iterator[Tuple[int, StoredEntry]]:
+        cursor = self.db.execute(
+            'SELECT id, payload, etag, last_modified, fetched_at FROM entries '
+            'WHERE kind = ? AND fetched_at >= ? ORDER BY fetched_at DESC LIMIT ?',
+            (kind, max(newer_than, self._oldest()), -1 if limit is None else limit),
+        )
+
+        for id, *row in cursor:
+            yield id, StoredEntry(*row)
+
+    def invalidate(self, kind: str, id: int) -> bool:
+        return self.db.execute('DELETE FROM entries WHERE kind = ? AND id = ?', (kind, id)).rowcount > 0
+
+    def prune(self) -> int:
+        return self.db.execute('DELETE FROM entries WHERE fetched_at < ?', (self._oldest(),)).rowcount
+
+    def clear(self) -> None:
+        self.db.execute('DELETE FROM entries')
+
+    async def close(self) -> None:
+        executor = self._executor
+        if executor is not None:
+            # the executor has a single thread, so this runs after every write queued before it
+            await asyncio.get_running_loop().run_in_executor(executor, lambda: None)
+            executor.shutdown(wait=False)
+            self._executor = None
+
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'size': len(self),
+            'hits': self.hits,
+            'misses': self.misses,
+            'revalidated': self.revalidated,
+        }
+
+
+class Cache:
+    __slots__ = ('users', 'gamepasses', 'ownership', 'disk')
+
+    def __init__(
+        self,
+        *,
+        users: Optional[TTLCache[int, Any]] = None,
+        gamepasses: Optional[TTLCache[int, Any]] = None,
+        ownership: Optional[TTLCache[Tuple[int, int], bool]] = None,
+        disk: Optional[DiskCache] = None,
+    ):
+        self.users: TTLCache[int, Any] = users if users is not None else TTLCache(ttl=300.0, maxsize=10_000)
+        self.gamepasses: TTLCache[int, Any] = gamepasses if gamepasses is not None else TTLCache(ttl=60.0, maxsize=10_000)
+        # keyed by (user_id, gamepass_id)
+        self.ownership: TTLCache[Tuple[int, int], bool] = (
+            ownership if ownership is not None else TTLCache(ttl=30.0, maxsize=100_000)
+        )
+        # optional persistent tier for users and gamepasses, survives restarts
+        self.disk: Optional[DiskCache] = disk
+
+    def invalidate_ownership(self, *, user_id: Optional[int] = None, gamepass_id: Optional[int] = None) -> int:
+        if user_id is not None and gamepass_id is not None:
+            return int(self.ownership.invalidate((user_id, gamepass_id)))
+
+        return self.ownership.invalidate_where(
+            lambda key: (user_id is None or key[0] == user_id) and (gamepass_id is None or key[1] == gamepass_id)
+        )
+
+    def clear(self) -> None:
+        self.users.clear()
+        self.gamepasses.clear()
+        self.ownership.clear()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        stats = {
+            'users': self.users.stats(),
+            'gamepasses': self.gamepasses.stats(),
+            'ownership': self.ownership.stats(),
+        }
+
+        if self.disk is not None:
+            stats['disk'] = self.disk.stats()
+
+        return stats
@@ -0,0 +1,191 @@
+"""
+MIT License
+
+Copyright (c) 2025 Gwarded
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import time
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from .transport import Response, Transport
+
+__all__ = ('RecordingTransport', 'ReplayTransport')
+
+CassetteKey = Tuple[str, str, str, str]
+
+# response headers that carry credentials, never written to a cassette
+_PRIVATE_HEADERS = frozenset(('set-cookie',))
+# kept with a placeholder value, replaying a 403 token challenge still needs the header to be present
+_REDACTED_HEADERS = frozenset(('x-csrf-token',))
+_REDACTED = 'REDACTED'
+
+
+def _key(method: str, url: str, params: Optional[Dict[str, Any]], body: Any) -> CassetteKey:
+    # canonical JSON so that the same request always maps to the same entry
+    return (
+        method,
+        url,
+        json.dumps(params, sort_keys=True, default=str) if params else '',
+        json.dumps(body, sort_keys=True, separators=(',', ':')) if body is not None else '',
+    )
+
+
+def _redact(headers: Dict[str, str]) -> Dict[str, str]:
+    redacted = {}
+    for key, value in headers.items():
+        name = key.lower()
+        if name in _PRIVATE_HEADERS:
+            continue
+        redacted[key] = _REDACTED if name in _REDACTED_HEADERS else value
+    return redacted
+
+
+def _encode_body(body: bytes) -> Tuple[str, str]:
+    try:
+        return 'text', body.decode('utf-8')
+    except UnicodeDecodeError:
+        return 'base64', base64.b64encode(body).decode('ascii')
+
+
+def _decode_body(encoding: str, body: str) -> bytes:
+    if encoding == 'base64':
+        return base64.b64decode(body)
+    return body.encode('utf-8')
+
+
+def _dumps(entry: Dict[str, Any]) -> str:
+    return json.dumps(entry, separators=(',', ':'))
+
+
+class RecordingTransport(Transport):
+    # request headers and cookies are never written, csrf tokens are redacted
+
+    def __init__(self, transport: Transport, path: Union[str, Path]):
+        self.transport = transport
+        self.path = Path(path)
+
+        self.recorded: int = 0
+        self._file: Optional[IO[str]] = None
+
+    async def start(self) -> None:
+        await self.transport.start()
+
+    async def warm_up(self, urls: Iterable[str], headers: Dict[str, str]) -> None:
+        await self.transport.warm_up(urls, headers)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Dict[str, str],
+        json: Any = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Response:
+        response = await self.transport.request(method, url, headers=headers, json=json, params=params)
+
+        if self._file is None:
+            self._file = self.path.open('a', encoding='utf-8')
+
+        encoding, body = _encode_body(response.body)
+        entry = {
+            'time': time.time(),
+            'method': method,
+            'url': url,
+            'params': params,
+            'request': json,
+            'status': response.status,
+            'headers': _redact(response.headers),
+            'encoding': encoding,
+            'body': body,
+        }
+        self._file.write(_dumps(entry) + '\n')
+        self._file.flush()
+        self.recorded += 1
+
+        return response
+
+    async def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+        await self.transport.close()
+
+
+class ReplayTransport(Transport):
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+
+        self.served: int = 0
+        self.missed: int = 0
+
+        # repeated requests are answered in recorded order, the last response keeps being served afterwards
+        self._responses: Dict[CassetteKey, List[Response]] = {}
+        self._positions: Dict[CassetteKey, int] = {}
+
+        with self.path.open(encoding='utf-8') as file:
+            for line in file:
+                if not line.strip():
+                    continue
+
+                entry = json.loads(line)
+                key = _key(entry['method'], entry['url'], entry.get('params'), entry.get('request'))
+                response = Response(
+                    entry['status'],
+                    _decode_body(entry.get('encoding', 'text'), entry['body']),
+                    entry.get('headers'),
+                )
+                self._responses.setdefault(key, []).append(response)
+
+    def __len__(self) -> int:
+        return sum(len(responses) for responses in self._responses.values())
+
+    def rewind(self) -> None:
+        self._positions.clear()
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Dict[str, str],
+        json: Any = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Response:
+        key = _key(method, url, params, json)
+        responses = self._responses.get(key)
+
+        if not responses:
+            self.missed += 1
+            raise LookupError(f'No recorded response for {method} {url}')
+
+        position = self._positions.get(key, 0)
+        self._positions[key] = position + 1
+        self.served += 1
+
+        return responses[min(position, len(responses) - 1)]
@@ -24,13 +24,14 @@ SOFTWARE.
 
 from __future__ import annotations
 
+import asyncio
 from types import TracebackType
-from typing import TYPE_CHECKING, Literal, Self, Type, Union, overload
+from typing import TYPE_CHECKING, AsyncIterator, Dict, Iterable, List, Literal, Optional, Self, Tuple, Type, Union, overload
 
-from .http import Connection
+from .http import OWNERSHIP_GROUP_THRESHOLD, Connection
 
 if TYPE_CHECKING:
-    from .abc import Gamepass, PartialUser, User
+    from .abc import Gamepass, PartialGamepass, PartialUser, User
 
 
 __all__ = ('Roblox',)
@@ -38,17 +39,28 @@ __all__ = ('Roblox',)
 
 class Roblox:
 
-    def __init__(self, *, authorization=None):
-        self.connection = Connection(authorization=authorization)
+    def __init__(self, *, authorization=None, **options):
+        self.connection = Connection(authorization=authorization, **options)
 
     async def __aenter__(self) -> Self:
+        await self.connection.warm_cache()
         return self
 
     async def __aexit__(self, exc_type: Type[BaseException], exc_value: BaseException, traceback: TracebackType) -> None:
         await self.connection.__aexit__(exc_type, exc_value, traceback)
 
+    async def start(self, *, warm_up: bool = False) -> None:
+        await self.connection.start(warm_up=warm_up)
+
+    async def close(self) -> None:
+        await self.connection.close()
+
+    @overload
+    async def get_user(self, target: int, *, partial: Literal[False] = ...) -> User:
+        pass
+
     @overload
-    async def get_user(self, target: int) -> User:
+    async def get_user(self, target: int, *, partial: Literal[True]) -> PartialUser:
         pass
 
     @overload
@@ -56,20 +68,39 @@ class Roblox:
         pass
 
     @overload
-    async def get_user(self, target: str, *, partial: Literal[False] = ...) -> User:
+    async def get_user(self, target: str, *, partial: Literal[False]) -> User:
         pass
 
-    async def get_user(self, target: Union[str, int], *, partial: bool = True) -> Union[User, PartialUser]:
+    async def get_user(self, target: Union[str, int], *, partial: Optional[bool] = None) -> Union[User, PartialUser]:
         if isinstance(target, int):
+            if partial is True:
+                return await self.connection.get_partial_user_by_id(target)
+
             return await self.connection.get_user_by_id(int(target))
 
         partial_user = await self.connection.get_user_by_name(target)
 
-        if not partial:
+        if partial is False:
             return await self.connection.get_user_by_id(partial_user.id)
 
         return partial_user
 
+    @overload
+    async def get_users(self, targets: Iterable[int]) -> List[Optional[PartialUser]]:
+        pass
+
+    @overload
+    async def get_users(self, targets: Iterable[str]) -> List[Optional[PartialUser]]:
+        pass
+
+    async def get_users(self, targets: Union[Iterable[int], Iterable[str]]) -> List[Optional[PartialUser]]:
+        targets = list(targets)
+
+        if targets and isinstance(targets[0], int):
+            return await self.connection.get_users_by_ids(targets)  # type: ignore
+
+        return await self.connection.get_users_by_names(targets)  # type: ignore
+
     @overload
     async def get_self(self, *, partial: Literal[True] = ...) -> PartialUser:
         pass
@@ -88,3 +119,44 @@ class Roblox:
 
     async def get_gamepass(self, target: int) -> Gamepass:
         return await self.connection.get_gamepass_by_id(target)
+
+    def queue_purchase(self, gamepass: Gamepass) -> asyncio.Future[None]:
+        return self.connection.purchases.purchase(gamepass)
+
+    def queue_revoke(self, gamepass: Gamepass) -> asyncio.Future[None]:
+        return self.connection.purchases.revoke(gamepass)
+
+    def iter_user_gamepasses(
+        self,
+        target: int,
+        *,
+        page_size: int = 100,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+        stream: bool = False,
+    ) -> AsyncIterator[PartialGamepass]:
+        return self.connection.iter_user_gamepasses(
+            target,
+            page_size=page_size,
+            limit=limit,
+            prefetch=prefetch,
+            stream=stream,
+        )
+
+    def iter_ownership(
+        self,
+        pairs: Iterable[Tuple[int, int]],
+        *,
+        concurrency: int = 10,
+        group_threshold: Optional[int] = OWNERSHIP_GROUP_THRESHOLD,
+    ) -> AsyncIterator[Tuple[Tuple[int, int], Union[bool, BaseException]]]:
+        return self.connection.iter_ownership(pairs, concurrency=concurrency, group_threshold=group_threshold)
+
+    async def check_ownership(
+        self,
+        pairs: Iterable[Tuple[int, int]],
+        *,
+        concurrency: int = 10,
+        group_threshold: Optional[int] = OWNERSHIP_GROUP_THRESHOLD,
+    ) -> Dict[Tuple[int, int], Union[bool, BaseException]]:
+        return await self.connection.check_ownership(pairs, concurrency=concurrency, group_threshold=group_threshold)
@@ -36,6 +36,7 @@ __all__ = (
     'GamepassAlreadyRevoked',
     'Forbidden',
     'PendingTransactionAlreadyExists',
+    'TooManyRequests',
 )
 
 
@@ -75,6 +76,13 @@ class InternalServerError(HTTPException):
         super().__init__('Internal error.')
 
 
+class TooManyRequests(HTTPException):
+
+    def __init__(self, retry_after: float):
+        self.retry_after: float = retry_after
+        super().__init__(f'Rate limited by the server, retry in {retry_after:.2f} seconds.')
+
+
 class Forbidden(HTTPException):
 
     def __init__(self, message: str):
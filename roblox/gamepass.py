@@ -25,25 +25,43 @@ SOFTWARE.
 from __future__ import annotations
 
 from datetime import datetime
-from typing import TYPE_CHECKING, Literal, Optional, Union, overload
+from typing import TYPE_CHECKING, Dict, Iterable, Literal, Optional, Union, overload
 
 from . import abc
 from .user import Creator
+from .utils import _payload_field, parse_time
 
 if TYPE_CHECKING:
     from .http import Connection
     from .types import Gamepass as GamepassPayload
     from .types import PartialGamepass as PartialGamepassPayload
+    from .types.user import Creator as CreatorPayload
 
     User = Union[abc.User, abc.PartialUser]
 
-__all__ = ('Gamepass',)
+__all__ = ('Gamepass', 'PartialGamepass', 'LazyGamepass', 'LazyPartialGamepass')
 
 
-class PartialGamepass:
+class _BasePartialGamepass:
+    __slots__ = ()
+
+    if TYPE_CHECKING:
+        raw_creator: CreatorPayload
+        name: str
+
+    def __str__(self) -> str:
+        return f'{self.name}'
+
+    @property
+    def creator(self) -> abc.Creator:
+        return Creator(self.raw_creator)
+
+
+class PartialGamepass(_BasePartialGamepass):
     __slots__ = (
         'connection',
         'data',
+        'raw_creator',
         'id',
         'asset_id',
         'name',
@@ -55,19 +73,21 @@ class PartialGamepass:
     if TYPE_CHECKING:
         connection: Connection
 
-        data: PartialGamepassPayload
+        data: Optional[PartialGamepassPayload]
 
+        raw_creator: CreatorPayload
         asset_id: int
         name: str
         description: str
         price_in_robux: Optional[int]
         is_for_sale: bool
 
-    def __init__(self, connection: Connection, data: PartialGamepassPayload):
+    def __init__(self, connection: Connection, data: PartialGamepassPayload, *, retain_payload: bool = True):
         self.connection = connection
 
-        self.data = data
+        self.data = data if retain_payload else None
 
+        self.raw_creator = data.get('creator')
         self.id = data.get('gamePassId')
         self.asset_id = data.get('iconAssetId')
         self.name = data.get('name')
@@ -75,18 +95,120 @@ class PartialGamepass:
         self.price_in_robux = data.get('price')
         self.is_for_sale = data.get('isForSale')
 
+
+class LazyPartialGamepass(_BasePartialGamepass):
+    __slots__ = ('connection', 'data')
+
+    if TYPE_CHECKING:
+        connection: Connection
+
+        data: PartialGamepassPayload
+
+    raw_creator: CreatorPayload = _payload_field('creator')
+    id: int = _payload_field('gamePassId')
+    asset_id: int = _payload_field('iconAssetId')
+    name: str = _payload_field('name')
+    description: str = _payload_field('description')
+    price_in_robux: Optional[int] = _payload_field('price')
+    is_for_sale: bool = _payload_field('isForSale')
+
+    def __init__(self, connection: Connection, data: PartialGamepassPayload):
+        self.connection = connection
+
+        self.data = data
+
+
+class _BaseGamepass:
+    # filled on the first access of created and updated
+    __slots__ = ('_created', '_updated')
+
+    if TYPE_CHECKING:
+        connection: Connection
+
+        _created: Optional[datetime]
+        _updated: Optional[datetime]
+        raw_created: str
+        raw_updated: str
+        raw_creator: CreatorPayload
+        id: int
+        product_id: int
+        name: str
+        price_in_robux: Optional[int]
+
     def __str__(self) -> str:
         return f'{self.name}'
 
     @property
-    def creator(self) -> abc.Creator:
-        return Creator(self.data.get('creator'))
+    def created(self) -> datetime:
+        if self._created is None:
+            self._created = parse_time(self.raw_created)
+        return self._created
+
+    @property
+    def updated(self) -> datetime:
+        if self._updated is None:
+            self._updated = parse_time(self.raw_updated)
+        return self._updated
+
+    @overload
+    async def creator(self, *, partial: Literal[True] = ...) -> abc.Creator:
+        pass
+
+    @overload
+    async def creator(self, *, partial: Literal[False] = ...) -> abc.User:
+        pass
+
+    async def creator(self, *, partial: bool = True) -> Union[abc.User, abc.Creator]:
+        creator_payload = self.raw_creator
+
+        assert creator_payload['CreatorType'] == 'User'
+
+        if partial is True:
+            return Creator(creator_payload)
+        else:
+            return await self.connection.get_user_by_id(creator_payload['Id'])
 
+    async def purchase(self) -> None:
+        assert self.price_in_robux is not None
+
+        expected_seller = await self.creator()
+
+        await self.connection.purchase_gamepass(
+            self.product_id,
+            self.price_in_robux,
+            expected_seller.id,
+            gamepass_id=self.id,
+        )
+
+    async def revoke(self) -> None:
+        assert self.price_in_robux is not None
+
+        expected_seller = await self.creator()
+
+        await self.connection.revoke_gamepass_ownership(self.id, self.price_in_robux, expected_seller.id)
+
+    async def has_user(self, target: Union[abc.User, abc.PartialUser, abc.Creator, int]) -> bool:
+        return await self.connection.get_user_gamepass_ownership(_get_user_id(target), self.id)
+
+    async def has_users(
+        self,
+        targets: Iterable[Union[abc.User, abc.PartialUser, abc.Creator, int]],
+        *,
+        concurrency: int = 10,
+    ) -> Dict[int, Union[bool, BaseException]]:
+        pairs = ((_get_user_id(target), self.id) for target in targets)
+        results = await self.connection.check_ownership(pairs, concurrency=concurrency)
 
-class Gamepass:
+        return {user_id: result for (user_id, _), result in results.items()}
+
+
+class Gamepass(_BaseGamepass):
     __slots__ = (
         'connection',
         'data',
+        'raw_created',
+        'raw_updated',
+        'raw_creator',
         'id',
         'target_id',
         'product_type',
@@ -111,8 +233,11 @@ class Gamepass:
     if TYPE_CHECKING:
         connection: Connection
 
-        data: GamepassPayload
+        data: Optional[GamepassPayload]
 
+        raw_created: str
+        raw_updated: str
+        raw_creator: CreatorPayload
         target_id: int
         product_type: str
         asset_id: int
@@ -132,12 +257,18 @@ class Gamepass:
         remaining: Optional[int]
         minimum_membership_level: int
 
-    def __init__(self, connection: Connection, data: GamepassPayload):
+    def __init__(self, connection: Connection, data: GamepassPayload, *, retain_payload: bool = True):
         self.connection = connection
 
-        self.data = data
+        self.data = data if retain_payload else None
+        self._created = None
+        self._updated = None
 
+        self.raw_created = data.get('Created')
+        self.raw_updated = data.get('Updated')
+        self.raw_creator = data.get('Creator')
         self.id = data.get('TargetId')
+        self.target_id = data.get('TargetId')
         self.product_type = data.get('ProductType')
         self.asset_id = data.get('AssetId')
         self.product_id = data.get('ProductId')
@@ -156,58 +287,55 @@ class Gamepass:
         self.remaining = data.get('Remaining')
         self.minimum_membership_level = data.get('MinimumMembershipLevel')
 
-    def __str__(self) -> str:
-        return f'{self.name}'
-
-    @property
-    def created(self) -> datetime:
-        return datetime.fromisoformat(self.data.get('Created').replace('Z', '+00:00'))
-
-    @property
-    def updated(self) -> datetime:
-        return datetime.fromisoformat(self.data.get('Updated').replace('Z', '+00:00'))
-
-    @overload
-    async def creator(self, *, partial: Literal[True] = ...) -> abc.Creator:
-        pass
-
-    @overload
-    async def creator(self, *, partial: Literal[False] = ...) -> abc.User:
-        pass
 
-    async def creator(self, *, partial: bool = True) -> Union[abc.User, abc.Creator]:
-        creator_payload = self.data.get('Creator')
-
-        assert creator_payload['CreatorType'] == 'User'
-
-        if partial is True:
-            return Creator(creator_payload)
-        else:
-            return await self.connection.get_user_by_id(creator_payload['Id'])
+class LazyGamepass(_BaseGamepass):
+    __slots__ = ('connection', 'data')
 
-    async def purchase(self) -> None:
-        assert self.price_in_robux is not None
+    if TYPE_CHECKING:
+        connection: Connection
 
-        expected_seller = await self.creator()
+        data: GamepassPayload
 
-        await self.connection.purchase_gamepass(self.product_id, self.price_in_robux, expected_seller.id)
+    raw_created: str = _payload_field('Created')
+    raw_updated: str = _payload_field('Updated')
+    raw_creator: CreatorPayload = _payload_field('Creator')
+    id: int = _payload_field('TargetId')
+    target_id: int = _payload_field('TargetId')
+    product_type: str = _payload_field('ProductType')
+    asset_id: int = _payload_field('AssetId')
+    product_id: int = _payload_field('ProductId')
+    name: str = _payload_field('Name')
+    description: str = _payload_field('Description')
+    asset_type_id: int = _payload_field('AssetTypeId')
+    icon_image_asset_id: int = _payload_field('IconImageAssetId')
+    price_in_robux: Optional[int] = _payload_field('PriceInRobux')
+    price_in_tickets: Optional[int] = _payload_field('PriceInTickets')
+    sales: int = _payload_field('Sales')
+    is_new: bool = _payload_field('IsNew')
+    is_for_sale: bool = _payload_field('IsForSale')
+    is_public_domain: bool = _payload_field('IsPublicDomain')
+    is_limited: bool = _payload_field('IsLimited')
+    is_limited_unique: bool = _payload_field('IsLimitedUnique')
+    remaining: Optional[int] = _payload_field('Remaining')
+    minimum_membership_level: int = _payload_field('MinimumMembershipLevel')
 
-    async def revoke(self) -> None:
-        assert self.price_in_robux is not None
+    def __init__(self, connection: Connection, data: GamepassPayload):
+        self.connection = connection
 
-        expected_seller = await self.creator()
+        self.data = data
+        self._created = None
+        self._updated = None
 
-        await self.connection.revoke_gamepass_ownership(self.id, self.price_in_robux, expected_seller.id)
 
-    async def has_user(self, target: Union[abc.User, abc.PartialUser, abc.Creator, int]) -> bool:
-        user_id: Optional[int] = None
+def _get_user_id(target: Union[abc.User, abc.PartialUser, abc.Creator, int]) -> int:
+    user_id: Optional[int] = None
 
-        if isinstance(target, abc.Object):
-            user_id = target.id
+    if isinstance(target, abc.Object):
+        user_id = target.id
 
-        elif isinstance(target, int):
-            user_id = target
+    elif isinstance(target, int):
+        user_id = target
 
-        assert user_id is not None
+    assert user_id is not None
 
-        return await self.connection.get_user_gamepass_ownership(user_id, self.id)
+    return user_id
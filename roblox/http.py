@@ -24,13 +24,38 @@ SOFTWARE.
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import itertools
+import logging
+import string
 import sys
+import time
 from types import TracebackType
-from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Self, Type, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Self,
+    Tuple,
+    Type,
+    Union,
+)
+from urllib.parse import quote
 
 import aiohttp
 
-from . import __version__
+from . import __version__, utils
+from .batch import Batcher
+from .cache import Cache, TTLCache
 from .errors import (
     Forbidden,
     GamepassAlreadyOwned,
@@ -39,191 +64,975 @@ from .errors import (
     NotEnoughFunds,
     NotFound,
     PendingTransactionAlreadyExists,
+    RobloxException,
+    TooManyRequests,
     Unauthorized,
     UnknownStatus,
 )
-from .gamepass import Gamepass, PartialGamepass
-from .user import PartialUser, User
+from .gamepass import Gamepass, LazyGamepass, LazyPartialGamepass, PartialGamepass
+from .instrumentation import RequestObserver
+from .purchases import PurchaseQueue
+from .ratelimit import RateLimiter
+from .transport import AiohttpTransport, Response, Transport, TransportConfig
+from .user import LazyUser, PartialUser, User
 
 if TYPE_CHECKING:
     from . import abc
+    from .types import Gamepass as GamepassPayload
+    from .types import PartialGamepass as PartialGamepassPayload
+    from .types import PartialUser as PartialUserPayload
+    from .types import RequestedUser as RequestedUserPayload
+    from .types import User as UserPayload
+
+    ModelMode = Literal['eager', 'lazy', 'discard']
 
 __all__ = ('Connection',)
 
+_log = logging.getLogger(__name__)
+
 
 class Route:
+    __slots__ = ('method', 'module', 'path', 'formatted_path', 'url')
+
+    # per-module base URL overrides, e.g. for a proxy or a local stand-in of the API
+    BASE_URLS: ClassVar[Dict[str, str]] = {}
 
-    def __init__(self, method: str, module: str, path: tuple[str, ...]):
+    def __init__(self, method: str, module: str, path: str, **parameters: Any):
         self.method: str = method
 
         self.module: str = module
-        self.path: tuple[str, ...] = path
+        # the unformatted template, shared by every request to the same endpoint
+        self.path: str = path
+
+        if parameters:
+            path = _format_path(path, parameters)
+        self.formatted_path: str = path
+        self.url: str = _get_base(module) + path
 
     def __str__(self):
         return self.url
 
     @property
     def base(self) -> str:
-        # don't include a trailing slash here to avoid double '//' when joining paths
-        return f'https://{self.module}.roblox.com'
+        return _get_base(self.module)
 
     @property
-    def url(self) -> str:
-        return self.base + '/' + '/'.join(self.path)
+    def key(self) -> str:
+        return f'{self.method} {self.module}{self.path}'
+
+    @classmethod
+    def override_base(cls, module: str, base: Optional[str]) -> None:
+        if base is None:
+            cls.BASE_URLS.pop(module, None)
+        else:
+            cls.BASE_URLS[module] = base.rstrip('/')
+
+        _BASES.clear()
+
+
+_BASES: Dict[str, str] = {}
+# path template -> (printf-style template, parameter names), compiled once per endpoint
+_TEMPLATES: Dict[str, Tuple[str, Tuple[str, ...]]] = {}
+_quote = functools.lru_cache(maxsize=1024)(quote)
+
+
+def _compile_path(path: str) -> Tuple[str, Tuple[str, ...]]:
+    parts: List[str] = []
+    names: List[str] = []
+    for literal, name, _, _ in string.Formatter().parse(path):
+        parts.append(literal.replace('%', '%%'))
+        if name is not None:
+            parts.append('%s')
+            names.append(name)
+
+    template = _TEMPLATES[path] = (''.join(parts), tuple(names))
+    return template
+
+
+def _format_path(path: str, parameters: Dict[str, Any]) -> str:
+    try:
+        template, names = _TEMPLATES[path]
+    except KeyError:
+        template, names = _compile_path(path)
+
+    if len(names) == 1:
+        value = parameters[names[0]]
+        return template % (_quote(value) if value.__class__ is str else value)
+
+    values = [parameters[name] for name in names]
+    return template % tuple([_quote(value) if value.__class__ is str else value for value in values])
+
+
+def _get_base(module: str) -> str:
+    try:
+        return _BASES[module]
+    except KeyError:
+        # don't include a trailing slash here to avoid double '//' when joining paths
+        base = _BASES[module] = sys.intern(Route.BASE_URLS.get(module) or f'https://{module}.roblox.com')
+        return base
+
+
+class _Validator:
+    __slots__ = ('headers', 'payload')
+
+    def __init__(self, etag: Optional[str], last_modified: Optional[str], payload: Any):
+        self.headers: Dict[str, str] = {}
+        self.payload: Any = payload
+
+        if etag is not None:
+            self.headers['If-None-Match'] = etag
+        if last_modified is not None:
+            self.headers['If-Modified-Since'] = last_modified
+
+
+def _is_conditional(headers: Optional[Dict[str, str]]) -> bool:
+    return headers is not None and ('If-None-Match' in headers or 'If-Modified-Since' in headers)
 
 
 class Http:
 
-    def __init__(self, *, authorization: Optional[str] = None):
-        self.session: Optional[aiohttp.ClientSession] = aiohttp.ClientSession()
+    def __init__(
+        self,
+        *,
+        authorization: Optional[str] = None,
+        ratelimiter: Optional[RateLimiter] = None,
+        transport: Optional[Union[TransportConfig, Transport]] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+        base_urls: Optional[Dict[str, str]] = None,
+        json_loads: Optional[Callable[[bytes], Any]] = None,
+        prefetch_csrf_token: bool = False,
+        max_csrf_retries: int = 2,
+        observers: Optional[Iterable[RequestObserver]] = None,
+        max_validators: int = 1024,
+    ):
+        self.json_loads: Callable[[bytes], Any] = json_loads if json_loads is not None else utils._from_json
+        self.ratelimiter: RateLimiter = ratelimiter if ratelimiter is not None else RateLimiter()
+        self.observers: List[RequestObserver] = list(observers) if observers is not None else []
 
+        if isinstance(transport, Transport):
+            self.transport: Transport = transport
+        else:
+            self.transport = AiohttpTransport(transport, session=session)
+
+        # per-module base URLs for this client only, these take precedence over Route.BASE_URLS
+        self.base_urls: Dict[str, str] = {module: base.rstrip('/') for module, base in (base_urls or {}).items()}
+
+        self.headers: Dict[str, str] = {'User-Agent': self.__str__()}
         if authorization:
-            self.session.headers.update({'Cookie': f'.ROBLOSECURITY={authorization}'})
-        self.session.headers.update({'User-Agent': self.__str__()})
+            self.headers['Cookie'] = f'.ROBLOSECURITY={authorization}'
+
+        self.prefetch_csrf_token: bool = prefetch_csrf_token
+        self.max_csrf_retries: int = max_csrf_retries
+        self.csrf_refreshes: int = 0
+        self._csrf_lock: Optional[asyncio.Lock] = None
+
+        # identical GETs that are in flight at the same time share one request
+        self.deduplicated: int = 0
+        self._inflight: Dict[Tuple[str, str, Any, Any], asyncio.Task[Tuple[Any, Response]]] = {}
+
+        # ETag / Last-Modified and the decoded payload of recent GETs, keyed by URL and params
+        self.not_modified: int = 0
+        self.validators: Optional[TTLCache[Tuple[str, Any], _Validator]] = (
+            TTLCache(maxsize=max_validators) if max_validators > 0 else None
+        )
 
     def __str__(self) -> str:
         return f'RobloxPy (https://github.com/Gwarded/roblox.py {__version__}) Python/{sys.version_info[0]} aiohttp/{aiohttp.__version__}'
 
+    def url_for(self, route: Route) -> str:
+        base = self.base_urls.get(route.module)
+        return route.url if base is None else base + route.formatted_path
+
+    async def start(self, *, warm_up: bool = False, modules: Iterable[str] = ('users', 'apis', 'inventory')) -> None:
+        await self.transport.start()
+
+        if warm_up:
+            await self.transport.warm_up([self.url_for(Route('HEAD', module, '/')) for module in modules], self.headers)
+
+    async def fetch_csrf_token(self) -> Optional[str]:
+        current = self.headers.get('X-CSRF-TOKEN')
+
+        if self._csrf_lock is None:
+            self._csrf_lock = asyncio.Lock()
+
+        async with self._csrf_lock:
+            # another request already refreshed the token while this one was waiting
+            if self.headers.get('X-CSRF-TOKEN') != current:
+                return self.headers.get('X-CSRF-TOKEN')
+
+            headers = {key: value for key, value in self.headers.items() if key != 'X-CSRF-TOKEN'}
+
+            # rejected for the missing token, which the response hands out without logging anything out
+            route = Route('POST', 'auth', '/v2/logout')
+            response = await self.transport.request(route.method, self.url_for(route), headers=headers)
+            token = response.headers.get('x-csrf-token')
+
+            if token is not None:
+                self.headers['X-CSRF-TOKEN'] = token
+                self.csrf_refreshes += 1
+
+            return token
+
     async def close(self):
-        assert self.session is not None
-
-        await self.session.close()
-        self.session = None
-
-    async def request(self, route: Route, *, data: Optional[Union[dict, list]] = None) -> tuple[Any, int]:
-        assert self.session is not None
-        async with self.session.request(
-            method=route.method,
-            json=data,
-            url=route.url,
-        ) as response:
-            status = response.status
+        await self.transport.close()
+
+    async def request(
+        self,
+        route: Route,
+        *,
+        data: Optional[Union[dict, list]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> tuple[Any, int]:
+        payload, response = await self.fetch(route, data=data, params=params)
+        return payload, response.status
+
+    async def fetch(
+        self,
+        route: Route,
+        *,
+        data: Optional[Union[dict, list]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[Any, Response]:
+        if route.method != 'GET' or data is not None:
+            return await self._request(route, data=data, params=params, headers=headers)
+
+        key = (
+            route.method,
+            self.url_for(route),
+            tuple(sorted(params.items())) if params else None,
+            tuple(sorted(headers.items())) if headers else None,
+        )
+        task = self._inflight.get(key)
+
+        if task is None:
+            task = asyncio.ensure_future(self._request(route, params=params, headers=headers))
+            self._inflight[key] = task
+            task.add_done_callback(lambda task: self._forget_inflight(key, task))
+        else:
+            self.deduplicated += 1
+
+        # shielded so that a cancelled caller doesn't cancel the request for the others
+        return await asyncio.shield(task)
+
+    async def stream(self, route: Route, key: str, *, params: Optional[Dict[str, Any]] = None) -> AsyncIterator[Any]:
+        # yields the elements of the array under key while the body is still arriving
+        ratelimiter = self.ratelimiter
+        url = self.url_for(route)
+        attempt = 0
+
+        while True:
+            await ratelimiter.acquire(route.module)
 
-            if status >= 300 and status <= 399:
-                raise UnknownStatus(response.status)
+            self._dispatch('on_request_start', route)
+            start = time.perf_counter()
+            status = 0
+            size = 0
+            streamed = False
 
-            if response.status == 401:
-                raise Unauthorized()
+            try:
+                async with self.transport.stream(route.method, url, headers=self.headers, params=params) as (head, chunks):
+                    status = head.status
 
-            if response.status == 403:
-                if response.headers.get('x-csrf-token') is not None:
-                    self.session.headers.add('X-CSRF-TOKEN', response.headers['x-csrf-token'])
-                    return await self.request(route=route, data=data)
+                    if status == 200 and head.content_type == 'application/json':
+                        streamed = True
+                        ratelimiter.update(route.module, head.headers)
 
-                payload: Dict[Literal['errors'], List[Dict[Literal['code', 'message'], Union[str, int]]]] = (
-                    await response.json()
+                        async def counted() -> AsyncIterator[bytes]:
+                            nonlocal size
+                            async for chunk in chunks:
+                                size += len(chunk)
+                                yield chunk
+
+                        async for item in utils._iter_json_array(counted(), key):
+                            yield item
+                    else:
+                        # anything else is handled from the full body, the request isn't sent again
+                        body = b''.join([chunk async for chunk in chunks])
+                        size = len(body)
+                        response = Response(status, body, head.headers, content_type=head.content_type, charset=head.charset)
+            except GeneratorExit:
+                # the consumer stopped early, which still counts as a finished request
+                self._dispatch('on_request_end', route, status, time.perf_counter() - start, size)
+                raise
+            except BaseException as exc:
+                self._dispatch('on_error', route, exc, time.perf_counter() - start)
+                raise
+
+            self._dispatch('on_request_end', route, status, time.perf_counter() - start, size)
+
+            if streamed:
+                return
+
+            if status == 429:
+                delay = ratelimiter.rate_limit(route.module, response.headers, attempt)
+
+                if attempt == ratelimiter.max_retries:
+                    raise TooManyRequests(delay)
+
+                attempt += 1
+                ratelimiter.retries += 1
+                self._dispatch('on_retry', route, 'ratelimit')
+                continue
+
+            ratelimiter.update(route.module, response.headers)
+            self._raise_for_status(response)
+
+            if response.content_type == 'application/json':
+                payload = self.json_loads(response.body)
+
+                for item in payload.get(key) or []:
+                    yield item
+
+            return
+
+    def _raise_for_status(self, response: Response) -> None:
+        status = response.status
+
+        if status >= 300 and status <= 399:
+            raise UnknownStatus(status)
+
+        if status == 401:
+            raise Unauthorized()
+
+        if status == 403:
+            payload: Dict[Literal['errors'], List[Dict[Literal['code', 'message'], Union[str, int]]]]
+            payload = self.json_loads(response.body)
+            error = payload['errors'][0]
+
+            raise Forbidden(str(error['message']))
+
+        if status == 404:
+            raise NotFound()
+
+        if status >= 500:
+            raise InternalServerError()
+
+    def _dispatch(self, hook: str, route: Route, *args: Any) -> None:
+        for observer in self.observers:
+            try:
+                getattr(observer, hook)(route, *args)
+            except Exception:
+                _log.exception('Ignoring exception in %s.%s', type(observer).__name__, hook)
+
+    def _forget_inflight(self, key: Tuple[str, str, Any, Any], task: asyncio.Task[Tuple[Any, Response]]) -> None:
+        self._inflight.pop(key, None)
+
+        # every caller may have been cancelled, don't let the error be reported as never retrieved
+        if not task.cancelled():
+            task.exception()
+
+    async def _request(
+        self,
+        route: Route,
+        *,
+        data: Optional[Union[dict, list]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[Any, Response]:
+        ratelimiter = self.ratelimiter
+        url = self.url_for(route)
+
+        if (
+            self.prefetch_csrf_token
+            and route.method != 'GET'
+            and 'Cookie' in self.headers
+            and 'X-CSRF-TOKEN' not in self.headers
+        ):
+            await self.fetch_csrf_token()
+
+        validator_key: Optional[Tuple[str, Any]] = None
+        validator: Optional[_Validator] = None
+
+        # callers that bring their own validators also deal with the 304 themselves
+        if self.validators is not None and route.method == 'GET' and not _is_conditional(headers):
+            validator_key = (url, tuple(sorted(params.items())) if params else None)
+            validator = self.validators.get(validator_key)
+
+            if validator is not None:
+                headers = {**headers, **validator.headers} if headers else validator.headers
+
+        attempt = 0
+        csrf_retries = 0
+
+        while True:
+            await ratelimiter.acquire(route.module)
+
+            sent_token = self.headers.get('X-CSRF-TOKEN')
+
+            self._dispatch('on_request_start', route)
+            start = time.perf_counter()
+
+            try:
+                response = await self.transport.request(
+                    route.method,
+                    url,
+                    headers={**self.headers, **headers} if headers else self.headers,
+                    json=data,
+                    params=params,
                 )
-                error = payload['errors'][0]
+            except BaseException as exc:
+                self._dispatch('on_error', route, exc, time.perf_counter() - start)
+                raise
+
+            status = response.status
+            body = response.body
+            self._dispatch('on_request_end', route, status, time.perf_counter() - start, len(body))
+
+            if status == 429:
+                delay = ratelimiter.rate_limit(route.module, response.headers, attempt)
+
+                if attempt == ratelimiter.max_retries:
+                    raise TooManyRequests(delay)
+
+                attempt += 1
+                ratelimiter.retries += 1
+                self._dispatch('on_retry', route, 'ratelimit')
+                continue
+
+            ratelimiter.update(route.module, response.headers)
+
+            if status == 304 and _is_conditional(headers):
+                if validator is not None:
+                    self.not_modified += 1
+                    return validator.payload, response
 
-                raise Forbidden(str(error['message']))
+                # the caller sent its own validators and still holds the payload
+                return None, response
 
-            if response.status == 404:
-                raise NotFound()
+            if status == 403:
+                token = response.headers.get('x-csrf-token')
 
-            if response.status >= 500:
-                raise InternalServerError()
+                if token is not None and csrf_retries < self.max_csrf_retries:
+                    csrf_retries += 1
+
+                    # concurrent requests that failed with the same stale token only replace it once
+                    if self.headers.get('X-CSRF-TOKEN') == sent_token:
+                        self.headers['X-CSRF-TOKEN'] = token
+                        self.csrf_refreshes += 1
+
+                    self._dispatch('on_retry', route, 'csrf')
+                    continue
+
+            self._raise_for_status(response)
 
             if response.content_type != 'application/json':
-                return await response.text(), response.status
+                return response.text(), response
+
+            payload = self.json_loads(body)
+
+            if validator_key is not None and self.validators is not None:
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
+
+                if etag is not None or last_modified is not None:
+                    self.validators.set(validator_key, _Validator(etag, last_modified, payload))
+                elif validator is not None:
+                    self.validators.invalidate(validator_key)
 
-            return await response.json(), response.status
+            return payload, response
+
+
+# the bulk user endpoints reject requests with more entries than these
+USERNAMES_PER_REQUEST = 100
+USER_IDS_PER_REQUEST = 100
+
+# pairs grouped per user at a time by iter_ownership, and how many of one user's pairs it takes
+# before a read of that user's gamepasses is cheaper than checking them one by one
+OWNERSHIP_WINDOW = 1000
+OWNERSHIP_GROUP_THRESHOLD = 5
 
 
 class Connection:
 
-    def __init__(self, *, authorization: Optional[str] = None):
-        self.http = Http(authorization=authorization)
+    def __init__(
+        self,
+        *,
+        authorization: Optional[str] = None,
+        batch_delay: float = 0.005,
+        cache: Optional[Cache] = None,
+        model_mode: ModelMode = 'eager',
+        purchases: Optional[PurchaseQueue] = None,
+        **options: Any,
+    ):
+        # everything else configures the underlying Http client
+        self.http = Http(authorization=authorization, **options)
+        self.cache: Optional[Cache] = cache
+        # 'lazy' reads model fields from the payload on access, 'discard' parses eagerly and drops the payload
+        self.model_mode: ModelMode = model_mode
+
+        # serializes this account's purchases and revokes, see Roblox.queue_purchase
+        self.purchases: PurchaseQueue = purchases if purchases is not None else PurchaseQueue()
+
+        self._authenticated_user: Optional[abc.PartialUser] = None
+
+        self._users_by_name: Batcher[str, abc.PartialUser] = Batcher(
+            self._fetch_users_by_names,
+            max_size=USERNAMES_PER_REQUEST,
+            delay=batch_delay,
+        )
+        self._users_by_id: Batcher[int, abc.PartialUser] = Batcher(
+            self._fetch_users_by_ids,
+            max_size=USER_IDS_PER_REQUEST,
+            delay=batch_delay,
+        )
 
     async def __aenter__(self) -> Self:
+        await self.warm_cache()
         return self
 
     async def __aexit__(self, exc_type: Type[BaseException], exc_value: BaseException, traceback: TracebackType) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        await self.purchases.close()
         await self.http.close()
 
-    async def get_user_by_name(self, name: str) -> abc.PartialUser:
+        if self.cache is not None and self.cache.disk is not None:
+            await self.cache.disk.close()
+
+    async def start(self, *, warm_up: bool = False) -> None:
+        await self.warm_cache()
+        await self.http.start(warm_up=warm_up)
+
+    def _create_user(self, data: UserPayload) -> abc.User:
+        if self.model_mode == 'lazy':
+            return LazyUser(self, data)
+
+        return User(self, data, retain_payload=self.model_mode != 'discard')
+
+    def _create_gamepass(self, data: GamepassPayload) -> abc.Gamepass:
+        if self.model_mode == 'lazy':
+            return LazyGamepass(self, data)
+
+        return Gamepass(self, data, retain_payload=self.model_mode != 'discard')
+
+    def _create_partial_gamepass(self, data: PartialGamepassPayload) -> abc.PartialGamepass:
+        if self.model_mode == 'lazy':
+            return LazyPartialGamepass(self, data)
+
+        return PartialGamepass(self, data, retain_payload=self.model_mode != 'discard')
+
+    async def _fetch_users_by_names(self, names: List[str]) -> Dict[str, abc.PartialUser]:
         payload, _ = await self.http.request(
-            Route(
-                'POST',
-                'users',
-                (
-                    'v1',
-                    'usernames',
-                    'users',
-                ),
-            ),
-            data={'usernames': [name], 'excludeBannedUsers': True},
+            Route('POST', 'users', '/v1/usernames/users'),
+            data={'usernames': names, 'excludeBannedUsers': True},
         )
 
-        if not payload.get('data'):
+        users: List[RequestedUserPayload] = payload.get('data') or []
+
+        return {user['requestedUsername'].lower(): PartialUser(user) for user in users}
+
+    async def get_user_by_name(self, name: str) -> abc.PartialUser:
+        user = await self._users_by_name.get(name.lower())
+
+        if user is None:
             raise NotFound()
 
-        return PartialUser(payload.get('data')[0])
+        return user
 
-    async def get_user_by_id(self, id: int) -> abc.User:
+    async def get_users_by_names(self, names: Iterable[str]) -> List[Optional[abc.PartialUser]]:
+        # usernames are case insensitive, duplicates share a single lookup inside the batcher
+        return await asyncio.gather(*(self._users_by_name.get(name.lower()) for name in names))
+
+    async def _fetch_users_by_ids(self, ids: List[int]) -> Dict[int, abc.PartialUser]:
         payload, _ = await self.http.request(
-            Route(
-                'GET',
-                'users',
-                ('v1', 'users', str(id)),
-            ),
+            Route('POST', 'users', '/v1/users'),
+            data={'userIds': ids, 'excludeBannedUsers': False},
         )
 
-        return User(self, payload)
+        users: List[PartialUserPayload] = payload.get('data') or []
+
+        return {user['id']: PartialUser(user) for user in users}
+
+    async def get_partial_user_by_id(self, id: int) -> abc.PartialUser:
+        user = await self._users_by_id.get(id)
+
+        if user is None:
+            raise NotFound()
+
+        return user
+
+    async def get_users_by_ids(self, ids: Iterable[int]) -> List[Optional[abc.PartialUser]]:
+        return await asyncio.gather(*(self._users_by_id.get(id) for id in ids))
+
+    async def _get_entity(
+        self,
+        kind: str,
+        id: int,
+        route: Route,
+        memory: Optional[TTLCache[int, Any]],
+        create: Callable[[Any], Any],
+    ) -> Any:
+        if memory is not None:
+            cached = memory.get(id)
+            if cached is not None:
+                return cached
+
+        disk = self.cache.disk if self.cache is not None else None
+        stored = await disk.run(disk.get, kind, id) if disk is not None else None
+        headers = None
+
+        if stored is not None:
+            # young enough to skip the request entirely, same freshness as the memory tier
+            if memory is not None and memory.ttl is not None and stored.age < memory.ttl:
+                entity = create(self.http.json_loads(stored.payload))
+                memory.set(id, entity, ttl=memory.ttl - stored.age)
+                return entity
+
+            headers = stored.validators()
+
+        payload, response = await self.http.fetch(route, headers=headers)
+
+        if disk is not None:
+            if response.status == 304:
+                # the validators came either from the disk entry or from the ones Http keeps in memory
+                if stored is not None:
+                    payload = self.http.json_loads(stored.payload)
+                    await disk.run(disk.touch, kind, id)
+            else:
+                await disk.run(
+                    disk.set,
+                    kind,
+                    id,
+                    response.body,
+                    response.headers.get('ETag'),
+                    response.headers.get('Last-Modified'),
+                )
+
+        entity = create(payload)
+
+        if memory is not None:
+            memory.set(id, entity)
+
+        return entity
+
+    async def get_user_by_id(self, id: int) -> abc.User:
+        return await self._get_entity(
+            'user',
+            id,
+            Route('GET', 'users', '/v1/users/{user_id}', user_id=id),
+            self.cache.users if self.cache is not None else None,
+            self._create_user,
+        )
 
     async def get_gamepass_by_id(self, id: int) -> abc.Gamepass:
-        payload, _ = await self.http.request(
-            Route(
-                'GET',
-                'apis',
-                ('game-passes', 'v1', 'game-passes', str(id), 'product-info'),
-            ),
+        return await self._get_entity(
+            'gamepass',
+            id,
+            Route('GET', 'apis', '/game-passes/v1/game-passes/{gamepass_id}/product-info', gamepass_id=id),
+            self.cache.gamepasses if self.cache is not None else None,
+            self._create_gamepass,
         )
 
-        return Gamepass(self, payload)
+    async def warm_cache(self) -> int:
+        if self.cache is None or self.cache.disk is None:
+            return 0
+
+        disk = self.cache.disk
+        loaded = 0
+
+        for kind, memory, create in (
+            ('user', self.cache.users, self._create_user),
+            ('gamepass', self.cache.gamepasses, self._create_gamepass),
+        ):
+            # older entries stay on disk and get revalidated on their next lookup instead
+            newer_than = time.time() - memory.ttl if memory.ttl is not None else 0.0
+
+            # most recently fetched last, so those are the last to be evicted
+            entries = await disk.run(lambda: list(disk.entries(kind, newer_than=newer_than, limit=memory.maxsize)))
+
+            for id, stored in reversed(entries):
+                ttl = memory.ttl - stored.age if memory.ttl is not None else None
+                memory.set(id, create(self.http.json_loads(stored.payload)), ttl=ttl)
+                loaded += 1
+
+        return loaded
 
     async def get_user_gamepass_ownership(self, user_id: int, gamepass_id: int) -> bool:
+        if self.cache is not None:
+            cached = self.cache.ownership.get((user_id, gamepass_id))
+            if cached is not None:
+                return cached
+
         payload, _ = await self.http.request(
             Route(
                 'GET',
                 'inventory',
-                ('v1', 'users', str(user_id), 'items', 'GamePass', str(gamepass_id)),
+                '/v1/users/{user_id}/items/GamePass/{gamepass_id}',
+                user_id=user_id,
+                gamepass_id=gamepass_id,
             ),
         )
 
-        if not payload.get('data'):
-            return False
+        owned = bool(payload.get('data'))
+
+        if self.cache is not None:
+            self.cache.ownership.set((user_id, gamepass_id), owned)
+
+        return owned
+
+    async def iter_ownership(
+        self,
+        pairs: Iterable[Tuple[int, int]],
+        *,
+        concurrency: int = 10,
+        group_threshold: Optional[int] = OWNERSHIP_GROUP_THRESHOLD,
+    ) -> AsyncIterator[Tuple[Tuple[int, int], Union[bool, BaseException]]]:
+        # pairs are pulled lazily a window at a time, users with many pairs in a window are answered from one
+        # paginated read of their gamepasses, the rest fans out single checks
+        pending = self._ownership_jobs(pairs, group_threshold)
+        results: asyncio.Queue[Optional[Tuple[Tuple[int, int], Union[bool, BaseException]]]] = asyncio.Queue(concurrency)
+
+        # errors raised by the pairs iterable itself, as opposed to the per-pair results
+        failures: List[BaseException] = []
+
+        async def worker() -> None:
+            try:
+                for user_id, gamepass_ids in pending:
+                    owned: Union[Dict[int, bool], BaseException]
+                    try:
+                        if len(gamepass_ids) == 1:
+                            owned = {gamepass_ids[0]: await self.get_user_gamepass_ownership(user_id, gamepass_ids[0])}
+                        else:
+                            owned = await self._get_user_ownerships(user_id, gamepass_ids)
+                    except (RobloxException, Exception) as exc:
+                        owned = exc
+
+                    for gamepass_id in gamepass_ids:
+                        result = owned if isinstance(owned, BaseException) else owned[gamepass_id]
+                        await results.put(((user_id, gamepass_id), result))
+            except asyncio.CancelledError:
+                raise
+            except BaseException as exc:
+                failures.append(exc)
+
+            # always posted unless cancelled, otherwise the consumer would wait for this worker forever
+            await results.put(None)
+
+        workers = [asyncio.ensure_future(worker()) for _ in range(max(concurrency, 1))]
+        finished = 0
+
+        try:
+            while finished < len(workers):
+                item = await results.get()
+
+                if item is None:
+                    if failures:
+                        raise failures[0]
+
+                    finished += 1
+                    continue
+
+                yield item
+        finally:
+            for task in workers:
+                task.cancel()
+
+    async def check_ownership(
+        self,
+        pairs: Iterable[Tuple[int, int]],
+        *,
+        concurrency: int = 10,
+        group_threshold: Optional[int] = OWNERSHIP_GROUP_THRESHOLD,
+    ) -> Dict[Tuple[int, int], Union[bool, BaseException]]:
+        return {
+            pair: result
+            async for pair, result in self.iter_ownership(pairs, concurrency=concurrency, group_threshold=group_threshold)
+        }
+
+    @staticmethod
+    def _ownership_jobs(
+        pairs: Iterable[Tuple[int, int]],
+        group_threshold: Optional[int],
+    ) -> Iterator[Tuple[int, List[int]]]:
+        iterator = iter(pairs)
+
+        while True:
+            window = list(itertools.islice(iterator, OWNERSHIP_WINDOW))
+            if not window:
+                return
+
+            by_user: Dict[int, List[int]] = {}
+            for user_id, gamepass_id in window:
+                by_user.setdefault(user_id, []).append(gamepass_id)
+
+            for user_id, gamepass_ids in by_user.items():
+                if group_threshold is not None and len(gamepass_ids) >= group_threshold:
+                    yield user_id, gamepass_ids
+                else:
+                    for gamepass_id in gamepass_ids:
+                        yield user_id, [gamepass_id]
+
+    async def _get_user_ownerships(self, user_id: int, gamepass_ids: List[int]) -> Dict[int, bool]:
+        owned: Dict[int, bool] = {}
+
+        if self.cache is not None:
+            for gamepass_id in gamepass_ids:
+                cached = self.cache.ownership.get((user_id, gamepass_id))
+                if cached is not None:
+                    owned[gamepass_id] = cached
+
+        if len(owned) < len(set(gamepass_ids)):
+            inventory = {gamepass.id async for gamepass in self.iter_user_gamepasses(user_id)}
+
+            for gamepass_id in gamepass_ids:
+                if gamepass_id not in owned:
+                    owned[gamepass_id] = gamepass_id in inventory
+
+                    if self.cache is not None:
+                        self.cache.ownership.set((user_id, gamepass_id), owned[gamepass_id])
+
+        return owned
+
+    def _invalidate_ownership(self, gamepass_id: Optional[int]) -> None:
+        if self.cache is None:
+            return
+
+        if gamepass_id is None:
+            # no way of telling which pass a product id belongs to, drop everything to stay correct
+            self.cache.ownership.clear()
+            return
+
+        user_id = self._authenticated_user.id if self._authenticated_user is not None else None
+        self.cache.invalidate_ownership(user_id=user_id, gamepass_id=gamepass_id)
+
+    def _user_gamepasses_page(
+        self,
+        id: int,
+        count: int,
+        exclusive_start_id: Optional[int],
+    ) -> Tuple[Route, Dict[str, Any]]:
+        params: Dict[str, Any] = {'count': count}
+        if exclusive_start_id is not None:
+            params['exclusiveStartId'] = exclusive_start_id
+
+        return Route('GET', 'apis', '/game-passes/v1/users/{user_id}/game-passes', user_id=id), params
+
+    async def _fetch_user_gamepasses_page(
+        self,
+        id: int,
+        count: int,
+        exclusive_start_id: Optional[int],
+    ) -> List[PartialGamepassPayload]:
+        route, params = self._user_gamepasses_page(id, count, exclusive_start_id)
+        payload, _ = await self.http.request(route, params=params)
+
+        return payload.get('gamePasses') or []
+
+    async def _stream_user_gamepasses(
+        self,
+        id: int,
+        page_size: int,
+        limit: Optional[int],
+    ) -> AsyncIterator[abc.PartialGamepass]:
+        yielded = 0
+        exclusive_start_id: Optional[int] = None
+
+        while True:
+            route, params = self._user_gamepasses_page(id, page_size, exclusive_start_id)
+            page = self.http.stream(route, 'gamePasses', params=params)
+            count = 0
+
+            try:
+                async for gamepass in page:
+                    yield self._create_partial_gamepass(gamepass)
+
+                    count += 1
+                    yielded += 1
+                    exclusive_start_id = gamepass['gamePassId']
+
+                    if limit is not None and yielded >= limit:
+                        return
+            finally:
+                await page.aclose()
+
+            # the server may cap count below page_size, so only an empty page ends the cursor
+            if count == 0:
+                return
+
+    async def iter_user_gamepasses(
+        self,
+        id: int,
+        *,
+        page_size: int = 100,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+        stream: bool = False,
+    ) -> AsyncIterator[abc.PartialGamepass]:
+        if limit is not None:
+            if limit <= 0:
+                return
+            page_size = min(page_size, limit)
+
+        if stream:
+            # models are built while each page downloads, so pages can't be prefetched
+            async for gamepass in self._stream_user_gamepasses(id, page_size, limit):
+                yield gamepass
+            return
+
+        yielded = 0
+        task: Optional[asyncio.Task[List[PartialGamepassPayload]]] = asyncio.ensure_future(
+            self._fetch_user_gamepasses_page(id, page_size, None)
+        )
+
+        try:
+            while task is not None:
+                page = await task
+                task = None
+
+                # the server may cap count below page_size, so only an empty page ends the cursor
+                has_more = len(page) > 0
+
+                if has_more and prefetch and (limit is None or yielded + len(page) < limit):
+                    task = asyncio.ensure_future(self._fetch_user_gamepasses_page(id, page_size, page[-1]['gamePassId']))
 
-        return True
+                for gamepass in page:
+                    yield self._create_partial_gamepass(gamepass)
 
-    async def get_user_gamepasses(self, id: int) -> List[abc.PartialGamepass]:
-        payload, _ = await self.http.request(Route('GET', 'apis', ('game-passes', 'v1', 'users', str(id), 'game-passes')))
+                    yielded += 1
+                    if limit is not None and yielded >= limit:
+                        return
 
-        gamepasses: List[abc.PartialGamepass] = list()
-        for gamepass in payload.get('gamePasses'):
-            gamepasses.append(PartialGamepass(self, gamepass))
+                if has_more and task is None:
+                    task = asyncio.ensure_future(self._fetch_user_gamepasses_page(id, page_size, page[-1]['gamePassId']))
+        finally:
+            if task is not None:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    # a prefetched page that failed after the consumer stopped, don't let it be reported as never retrieved
+                    task.exception()
 
-        return gamepasses
+    async def get_user_gamepasses(self, id: int, *, limit: Optional[int] = None) -> List[abc.PartialGamepass]:
+        return [gamepass async for gamepass in self.iter_user_gamepasses(id, limit=limit)]
 
     async def get_authenticated_user(self) -> abc.PartialUser:
-        payload, _ = await self.http.request(Route('GET', 'users', ('v1', 'users', 'authenticated')))
+        payload, _ = await self.http.request(Route('GET', 'users', '/v1/users/authenticated'))
 
         self._authenticated_user = PartialUser(payload)
 
         return PartialUser(payload)
 
-    async def purchase_gamepass(self, product_id: int, expected_price: int, expected_seller_id: int) -> None:
-        payload, _ = await self.http.request(
-            Route(
-                'POST',
-                'apis',
-                ('game-passes', 'v1', 'game-passes', str(product_id), 'purchase'),
-            ),
-            data={
-                'expectedCurrency': 1,
-                'expectedPrice': expected_price,
-                'expectedSellerId': expected_seller_id,
-            },
-        )
+    async def purchase_gamepass(
+        self,
+        product_id: int,
+        expected_price: int,
+        expected_seller_id: int,
+        *,
+        gamepass_id: Optional[int] = None,
+    ) -> None:
+        try:
+            payload, _ = await self.http.request(
+                Route('POST', 'apis', '/game-passes/v1/game-passes/{product_id}/purchase', product_id=product_id),
+                data={
+                    'expectedCurrency': 1,
+                    'expectedPrice': expected_price,
+                    'expectedSellerId': expected_seller_id,
+                },
+            )
+        finally:
+            self._invalidate_ownership(gamepass_id)
 
         if payload.get('reason') == 'AlreadyOwned':
             raise GamepassAlreadyOwned()
@@ -237,14 +1046,17 @@ class Connection:
             raise PendingTransactionAlreadyExists()
 
     async def revoke_gamepass_ownership(self, id: int, expected_price: int, expected_seller_id: int) -> None:
-        payload, _ = await self.http.request(
-            Route('POST', 'apis', ('game-passes', 'v1', 'game-passes', str(id) + ':revokeownership')),
-            data={
-                'expectedCurrency': 1,
-                'expectedPrice': expected_price,
-                'expectedSellerId': expected_seller_id,
-            },
-        )
+        try:
+            payload, _ = await self.http.request(
+                Route('POST', 'apis', '/game-passes/v1/game-passes/{gamepass_id}:revokeownership', gamepass_id=id),
+                data={
+                    'expectedCurrency': 1,
+                    'expectedPrice': expected_price,
+                    'expectedSellerId': expected_seller_id,
+                },
+            )
+        finally:
+            self._invalidate_ownership(id)
 
         if not isinstance(payload, str) and payload.get('errorCode') == 'PassAlreadyRevoked':
             raise GamepassAlreadyRevoked()
@@ -0,0 +1,222 @@
+"""
+MIT License
+
+Copyright (c) 2025 Gwarded
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+from collections import Counter, defaultdict, deque
+from typing import TYPE_CHECKING, Any, Deque, Dict, Iterable, Literal, Optional
+
+try:
+    import prometheus_client  # type: ignore
+except ModuleNotFoundError:
+    HAS_PROMETHEUS = False
+else:
+    HAS_PROMETHEUS = True
+
+if TYPE_CHECKING:
+    from .http import Route
+
+    RetryReason = Literal['ratelimit', 'csrf']
+
+__all__ = (
+    'RequestObserver',
+    'LatencyCollector',
+    'InFlightGauge',
+    'ResponseSizeCollector',
+    'StatusCollector',
+    'PrometheusObserver',
+)
+
+
+class RequestObserver:
+    # every hook is keyed on Route.key, the method plus the unformatted path template
+
+    def on_request_start(self, route: Route) -> None:
+        pass
+
+    def on_request_end(self, route: Route, status: int, elapsed: float, size: int) -> None:
+        pass
+
+    def on_retry(self, route: Route, reason: RetryReason) -> None:
+        pass
+
+    def on_error(self, route: Route, error: BaseException, elapsed: float) -> None:
+        pass
+
+
+def _percentile(samples: Iterable[float], quantile: float) -> float:
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+
+    index = min(len(ordered) - 1, max(0, round(quantile * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class LatencyCollector(RequestObserver):
+
+    def __init__(self, *, max_samples: int = 1024):
+        self.max_samples = max_samples
+        # a sliding window of the most recent samples per route
+        self.samples: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=self.max_samples))
+
+    def on_request_end(self, route: Route, status: int, elapsed: float, size: int) -> None:
+        self.samples[route.key].append(elapsed)
+
+    def on_error(self, route: Route, error: BaseException, elapsed: float) -> None:
+        self.samples[route.key].append(elapsed)
+
+    def percentiles(self, key: Optional[str] = None, quantiles: Iterable[float] = (0.5, 0.9, 0.99)) -> Dict[float, float]:
+        if key is None:
+            samples = [sample for window in self.samples.values() for sample in window]
+        else:
+            samples = list(self.samples.get(key, ()))
+
+        return {quantile: _percentile(samples, quantile) for quantile in quantiles}
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        return {
+            key: {'count': len(window), 'p50': _percentile(window, 0.5), 'p99': _percentile(window, 0.99)}
+            for key, window in self.samples.items()
+        }
+
+
+class InFlightGauge(RequestObserver):
+
+    def __init__(self):
+        self.current: Dict[str, int] = defaultdict(int)
+        self.peak: Dict[str, int] = defaultdict(int)
+
+    @property
+    def total(self) -> int:
+        return sum(self.current.values())
+
+    def on_request_start(self, route: Route) -> None:
+        key = route.key
+        self.current[key] += 1
+        self.peak[key] = max(self.peak[key], self.current[key])
+
+    def on_request_end(self, route: Route, status: int, elapsed: float, size: int) -> None:
+        self.current[route.key] -= 1
+
+    def on_error(self, route: Route, error: BaseException, elapsed: float) -> None:
+        self.current[route.key] -= 1
+
+
+class ResponseSizeCollector(RequestObserver):
+
+    def __init__(self):
+        self.count: Dict[str, int] = defaultdict(int)
+        self.total: Dict[str, int] = defaultdict(int)
+        self.largest: Dict[str, int] = defaultdict(int)
+
+    def on_request_end(self, route: Route, status: int, elapsed: float, size: int) -> None:
+        key = route.key
+        self.count[key] += 1
+        self.total[key] += size
+        self.largest[key] = max(self.largest[key], size)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        return {
+            key: {
+                'count': count,
+                'total': self.total[key],
+                'mean': self.total[key] / count,
+                'max': self.largest[key],
+            }
+            for key, count in self.count.items()
+        }
+
+
+class StatusCollector(RequestObserver):
+
+    def __init__(self):
+        self.statuses: Dict[str, Counter[int]] = defaultdict(Counter)
+        self.retries: Dict[str, Counter[str]] = defaultdict(Counter)
+        self.errors: Dict[str, Counter[str]] = defaultdict(Counter)
+
+    def on_request_end(self, route: Route, status: int, elapsed: float, size: int) -> None:
+        self.statuses[route.key][status] += 1
+
+    def on_retry(self, route: Route, reason: RetryReason) -> None:
+        self.retries[route.key][reason] += 1
+
+    def on_error(self, route: Route, error: BaseException, elapsed: float) -> None:
+        self.errors[route.key][type(error).__name__] += 1
+
+
+class PrometheusObserver(RequestObserver):
+    # does nothing when prometheus_client isn't installed
+
+    def __init__(self, *, namespace: str = 'roblox', registry: Any = None):
+        self.enabled: bool = HAS_PROMETHEUS
+
+        if not self.enabled:
+            return
+
+        kwargs: Dict[str, Any] = {'namespace': namespace}
+        if registry is not None:
+            kwargs['registry'] = registry
+
+        self.latency = prometheus_client.Histogram(
+            'request_duration_seconds', 'Time spent on Roblox API requests.', ['route'], **kwargs
+        )
+        self.responses = prometheus_client.Counter(
+            'responses_total', 'Roblox API responses by status.', ['route', 'status'], **kwargs
+        )
+        self.response_bytes = prometheus_client.Counter(
+            'response_bytes_total', 'Bytes received from the Roblox API.', ['route'], **kwargs
+        )
+        self.in_flight = prometheus_client.Gauge(
+            'requests_in_flight', 'Roblox API requests currently in flight.', ['route'], **kwargs
+        )
+        self.retries = prometheus_client.Counter(
+            'retries_total', 'Roblox API requests that were replayed.', ['route', 'reason'], **kwargs
+        )
+        self.errors = prometheus_client.Counter(
+            'errors_total', 'Roblox API requests that failed without a response.', ['route', 'error'], **kwargs
+        )
+
+    def on_request_start(self, route: Route) -> None:
+        if self.enabled:
+            self.in_flight.labels(route.key).inc()
+
+    def on_request_end(self, route: Route, status: int, elapsed: float, size: int) -> None:
+        if self.enabled:
+            key = route.key
+            self.in_flight.labels(key).dec()
+            self.latency.labels(key).observe(elapsed)
+            self.responses.labels(key, str(status)).inc()
+            self.response_bytes.labels(key).inc(size)
+
+    def on_retry(self, route: Route, reason: RetryReason) -> None:
+        if self.enabled:
+            self.retries.labels(route.key, reason).inc()
+
+    def on_error(self, route: Route, error: BaseException, elapsed: float) -> None:
+        if self.enabled:
+            key = route.key
+            self.in_flight.labels(key).dec()
+            self.latency.labels(key).observe(elapsed)
+            self.errors.labels(key, type(error).__name__).inc()
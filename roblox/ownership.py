@@ -0,0 +1,297 @@
+"""
+MIT License
+
+Copyright (c) 2025 Gwarded
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple, Union
+
+if TYPE_CHECKING:
+    from .client import Roblox
+
+__all__ = ('OwnershipIndex', 'OwnershipDiff')
+
+_MAGIC = b'RBXOWN1\n'
+
+
+class OwnershipDiff(NamedTuple):
+    added: List[int]
+    removed: List[int]
+
+
+class _Entry:
+    # every tracked user, owner or not, as sorted ids with parallel arrays of the last check time (0 if never)
+    # and an ownership flag, about 17 bytes per pair
+    __slots__ = ('users', 'checked', 'owned')
+
+    def __init__(
+        self,
+        users: Optional[array[int]] = None,
+        checked: Optional[array[float]] = None,
+        owned: Optional[bytearray] = None,
+    ):
+        self.users: array[int] = users if users is not None else array('q')
+        self.checked: array[float] = checked if checked is not None else array('d')
+        self.owned: bytearray = owned if owned is not None else bytearray()
+
+    def find(self, user_id: int) -> int:
+        index = bisect_left(self.users, user_id)
+
+        if index < len(self.users) and self.users[index] == user_id:
+            return index
+        return -1
+
+    def add(self, user_ids: Iterable[int]) -> None:
+        new = sorted({user_id for user_id in user_ids if self.find(user_id) < 0})
+        if not new:
+            return
+
+        if len(new) == 1:
+            index = bisect_left(self.users, new[0])
+            self.users.insert(index, new[0])
+            self.checked.insert(index, 0.0)
+            self.owned.insert(index, 0)
+            return
+
+        # merge in one pass instead of shifting the arrays for every insert
+        users, checked, owned = array('q'), array('d'), bytearray()
+        old = 0
+
+        for user_id in new:
+            end = bisect_left(self.users, user_id, old)
+            users.extend(self.users[old:end])
+            checked.extend(self.checked[old:end])
+            owned.extend(self.owned[old:end])
+            users.append(user_id)
+            checked.append(0.0)
+            owned.append(0)
+            old = end
+
+        users.extend(self.users[old:])
+        checked.extend(self.checked[old:])
+        owned.extend(self.owned[old:])
+        self.users, self.checked, self.owned = users, checked, owned
+
+    def remove(self, user_ids: Iterable[int]) -> None:
+        drop = set(user_ids)
+        keep = [index for index, user_id in enumerate(self.users) if user_id not in drop]
+
+        self.users = array('q', [self.users[index] for index in keep])
+        self.checked = array('d', [self.checked[index] for index in keep])
+        self.owned = bytearray(self.owned[index] for index in keep)
+
+
+class OwnershipIndex:
+    # who owns which gamepass, as last seen, so that only stale entries need another request
+
+    def __init__(self, *, max_age: float = 300.0):
+        self.max_age: float = max_age
+        self.failed: int = 0
+
+        self._entries: Dict[int, _Entry] = {}
+
+    def __len__(self) -> int:
+        return sum(len(entry.users) for entry in self._entries.values())
+
+    def __contains__(self, pair: Tuple[int, int]) -> bool:
+        user_id, gamepass_id = pair
+        entry = self._entries.get(gamepass_id)
+
+        if entry is None:
+            return False
+
+        index = entry.find(user_id)
+        return index >= 0 and entry.owned[index] == 1
+
+    @property
+    def gamepasses(self) -> List[int]:
+        return list(self._entries)
+
+    def owners(self, gamepass_id: int) -> Set[int]:
+        entry = self._entries.get(gamepass_id)
+
+        if entry is None:
+            return set()
+
+        return {user_id for user_id, owned in zip(entry.users, entry.owned) if owned}
+
+    def has(self, user_id: int, gamepass_id: int) -> Optional[bool]:
+        # None when the pair was never checked
+        entry = self._entries.get(gamepass_id)
+        index = entry.find(user_id) if entry is not None else -1
+
+        if entry is None or index < 0 or not entry.checked[index]:
+            return None
+
+        return entry.owned[index] == 1
+
+    def track(self, gamepass_id: int, user_ids: Iterable[int] = ()) -> None:
+        entry = self._entries.get(gamepass_id)
+        if entry is None:
+            entry = self._entries[gamepass_id] = _Entry()
+
+        entry.add(user_ids)
+
+    def untrack(self, gamepass_id: int, user_ids: Optional[Iterable[int]] = None) -> None:
+        if user_ids is None:
+            self._entries.pop(gamepass_id, None)
+            return
+
+        entry = self._entries.get(gamepass_id)
+        if entry is None:
+            return
+
+        entry.remove(user_ids)
+
+    def set(self, user_id: int, gamepass_id: int, owned: bool, *, checked_at: Optional[float] = None) -> Optional[bool]:
+        # returns whether the user gained (True) or lost (False) the pass, None if nothing changed
+        self.track(gamepass_id, (user_id,))
+        entry = self._entries[gamepass_id]
+        index = entry.find(user_id)
+
+        known = entry.checked[index] > 0
+        was_owner = entry.owned[index] == 1
+        entry.checked[index] = checked_at if checked_at is not None else time.time()
+        entry.owned[index] = 1 if owned else 0
+
+        if owned == was_owner or (not known and not owned):
+            return None
+
+        return owned
+
+    def stale(self, *, max_age: Optional[float] = None) -> Iterator[Tuple[int, int]]:
+        oldest = time.time() - (max_age if max_age is not None else self.max_age)
+
+        for gamepass_id, entry in self._entries.items():
+            for user_id, checked_at in zip(entry.users, entry.checked):
+                if checked_at < oldest:
+                    yield user_id, gamepass_id
+
+    async def refresh(
+        self,
+        client: Roblox,
+        *,
+        max_age: Optional[float] = None,
+        concurrency: int = 10,
+    ) -> Dict[int, OwnershipDiff]:
+        pairs = list(self.stale(max_age=max_age))
+        diffs: Dict[int, OwnershipDiff] = {}
+
+        # the client's own cache may be younger than max_age but still older than the index entry
+        cache = client.connection.cache
+        if cache is not None:
+            for pair in pairs:
+                cache.ownership.invalidate(pair)
+
+        async for (user_id, gamepass_id), result in client.iter_ownership(pairs, concurrency=concurrency):
+            if isinstance(result, BaseException):
+                # left stale, the next refresh tries it again
+                self.failed += 1
+                continue
+
+            self._record(diffs, user_id, gamepass_id, result)
+
+        return diffs
+
+    async def refresh_user(self, client: Roblox, user_id: int) -> Dict[int, OwnershipDiff]:
+        # one paginated inventory read covers every gamepass this user is tracked for
+        owned = {gamepass.id async for gamepass in client.iter_user_gamepasses(user_id)}
+        diffs: Dict[int, OwnershipDiff] = {}
+        checked_at = time.time()
+
+        for gamepass_id, entry in self._entries.items():
+            # only pairs somebody asked to track, the inventory read doesn't add new ones
+            if entry.find(user_id) >= 0:
+                self._record(diffs, user_id, gamepass_id, gamepass_id in owned, checked_at=checked_at)
+
+        return diffs
+
+    def _record(
+        self,
+        diffs: Dict[int, OwnershipDiff],
+        user_id: int,
+        gamepass_id: int,
+        owned: bool,
+        *,
+        checked_at: Optional[float] = None,
+    ) -> None:
+        change = self.set(user_id, gamepass_id, owned, checked_at=checked_at)
+
+        if change is None:
+            return
+
+        diff = diffs.get(gamepass_id)
+        if diff is None:
+            diff = diffs[gamepass_id] = OwnershipDiff([], [])
+
+        (diff.added if change else diff.removed).append(user_id)
+
+    def save(self, path: Union[str, Path]) -> None:
+        # a JSON header followed by sorted user ids, check times and ownership flags as packed arrays per gamepass
+        header = [[gamepass_id, len(entry.users)] for gamepass_id, entry in self._entries.items()]
+
+        with open(path, 'wb') as file:
+            file.write(_MAGIC)
+            file.write(json.dumps({'max_age': self.max_age, 'gamepasses': header}).encode() + b'\n')
+
+            # the in-memory arrays are already in their on-disk layout
+            for entry in self._entries.values():
+                entry.users.tofile(file)
+                entry.checked.tofile(file)
+                file.write(entry.owned)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> OwnershipIndex:
+        with open(path, 'rb') as file:
+            if file.readline() != _MAGIC:
+                raise ValueError(f'{path} is not an ownership index')
+
+            header = json.loads(file.readline())
+            index = cls(max_age=header['max_age'])
+
+            for gamepass_id, count in header['gamepasses']:
+                users, checked = array('q'), array('d')
+                users.fromfile(file, count)
+                checked.fromfile(file, count)
+                owned = bytearray(file.read(count))
+
+                if len(owned) != count:
+                    raise ValueError(f'{path} is truncated')
+
+                index._entries[gamepass_id] = _Entry(users, checked, owned)
+
+        return index
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'gamepasses': len(self._entries),
+            'tracked': len(self),
+            'owners': sum(entry.owned.count(1) for entry in self._entries.values()),
+            'stale': sum(1 for _ in self.stale()),
+            'failed': self.failed,
+        }
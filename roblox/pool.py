@@ -0,0 +1,266 @@
+"""
+MIT License
+
+Copyright (c) 2025 Gwarded
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import itertools
+import time
+from types import TracebackType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Self,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from .client import Roblox
+from .errors import Unauthorized
+from .transport import Transport
+
+if TYPE_CHECKING:
+    from .abc import Gamepass, PartialUser, User
+
+__all__ = ('RobloxPool', 'PoolAccount')
+
+T = TypeVar('T')
+
+_PER_ACCOUNT_OPTIONS = ('ratelimiter', 'purchases', 'observers', 'session', 'cache')
+
+
+class PoolAccount:
+    __slots__ = (
+        'index',
+        'client',
+        'healthy',
+        'in_flight',
+        'requests',
+        'errors',
+        'evicted_at',
+    )
+
+    def __init__(self, index: int, client: Roblox):
+        self.index: int = index
+        self.client: Roblox = client
+
+        self.healthy: bool = True
+        self.in_flight: int = 0
+        self.requests: int = 0
+        self.errors: int = 0
+        self.evicted_at: Optional[float] = None
+
+    def __repr__(self) -> str:
+        return f'<PoolAccount index={self.index} healthy={self.healthy} in_flight={self.in_flight}>'
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'healthy': self.healthy,
+            'in_flight': self.in_flight,
+            'requests': self.requests,
+            'errors': self.errors,
+            'rate_limited': self.client.connection.http.ratelimiter.rate_limited,
+            'purchases': len(self.client.connection.purchases),
+        }
+
+
+class RobloxPool:
+    # every account gets its own client, so cookies, CSRF tokens and rate limits are never shared
+
+    def __init__(
+        self,
+        authorizations: Iterable[str],
+        *,
+        account_options: Optional[Callable[[int], Dict[str, Any]]] = None,
+        **options: Any,
+    ):
+        # stateful objects given once would end up shared by every account, these have to come from account_options
+        shared = [key for key in _PER_ACCOUNT_OPTIONS if key in options]
+        if isinstance(options.get('transport'), Transport):
+            shared.append('transport')
+
+        if shared:
+            raise TypeError(f'{", ".join(shared)} must be built per account, pass them through account_options')
+
+        self.accounts: List[PoolAccount] = []
+
+        for index, authorization in enumerate(authorizations):
+            extra = account_options(index) if account_options is not None else {}
+            self.accounts.append(PoolAccount(index, Roblox(authorization=authorization, **{**options, **extra})))
+
+        if not self.accounts:
+            raise ValueError('RobloxPool needs at least one account')
+
+        self.retries: int = 0
+        self.evictions: int = 0
+        # breaks ties between equally loaded accounts
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self.accounts)
+
+    async def __aenter__(self) -> Self:
+        for account in self.accounts:
+            await account.client.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type: Type[BaseException], exc_value: BaseException, traceback: TracebackType) -> None:
+        await self.close()
+
+    async def start(self, *, warm_up: bool = False) -> None:
+        for account in self.accounts:
+            await account.client.start(warm_up=warm_up)
+
+    async def close(self) -> None:
+        for account in self.accounts:
+            await account.client.close()
+
+    @property
+    def healthy(self) -> List[PoolAccount]:
+        return [account for account in self.accounts if account.healthy]
+
+    def evict(self, account: PoolAccount) -> None:
+        if not account.healthy:
+            return
+
+        account.healthy = False
+        account.evicted_at = time.time()
+        self.evictions += 1
+
+    def restore(self, account: PoolAccount) -> None:
+        account.healthy = True
+        account.evicted_at = None
+
+    def least_loaded(self) -> PoolAccount:
+        healthy = self.healthy
+
+        if not healthy:
+            raise Unauthorized()
+
+        # rotate the starting point so that idle accounts share the load evenly
+        offset = next(self._counter) % len(healthy)
+        return min(healthy[offset:] + healthy[:offset], key=lambda account: account.in_flight)
+
+    def pinned(self, key: int) -> PoolAccount:
+        # mapped over every account, not just the healthy ones, so evictions never move a key to another account's queue
+        account = self.accounts[key % len(self.accounts)]
+
+        if not account.healthy:
+            raise Unauthorized()
+
+        return account
+
+    async def run(self, call: Callable[[Roblox], Awaitable[T]], *, account: Optional[PoolAccount] = None) -> T:
+        # reads go to the least loaded account and move on to another one if it was logged out,
+        # calls pinned to an account never leave it
+        attempts = 1 if account is not None else len(self.accounts)
+
+        for attempt in range(attempts):
+            target = account if account is not None else self.least_loaded()
+
+            if attempt:
+                self.retries += 1
+
+            target.in_flight += 1
+            target.requests += 1
+
+            try:
+                return await call(target.client)
+            except Unauthorized:
+                target.errors += 1
+                self.evict(target)
+
+                if account is not None or not self.healthy:
+                    raise
+            except BaseException:
+                target.errors += 1
+                raise
+            finally:
+                target.in_flight -= 1
+
+        raise Unauthorized()
+
+    async def get_user(self, target: Union[str, int], *, partial: Optional[bool] = None) -> Union[User, PartialUser]:
+        return await self.run(lambda client: client.get_user(target, partial=partial))  # type: ignore
+
+    async def get_users(self, targets: Union[Iterable[int], Iterable[str]]) -> List[Optional[PartialUser]]:
+        targets = list(targets)
+        return await self.run(lambda client: client.get_users(targets))
+
+    async def get_gamepass(self, target: int) -> Gamepass:
+        return await self.run(lambda client: client.get_gamepass(target))
+
+    async def check_ownership(
+        self,
+        pairs: Iterable[Tuple[int, int]],
+        *,
+        concurrency: int = 10,
+    ) -> Dict[Tuple[int, int], Union[bool, BaseException]]:
+        pairs = list(pairs)
+        return await self.run(lambda client: client.check_ownership(pairs, concurrency=concurrency))
+
+    async def purchase(self, gamepass: Union[Gamepass, int], *, account: Optional[PoolAccount] = None) -> None:
+        await self._mutate('purchase', gamepass, account)
+
+    async def revoke(self, gamepass: Union[Gamepass, int], *, account: Optional[PoolAccount] = None) -> None:
+        await self._mutate('revoke', gamepass, account)
+
+    async def _mutate(self, action: str, gamepass: Union[Gamepass, int], account: Optional[PoolAccount]) -> None:
+        gamepass_id = gamepass if isinstance(gamepass, int) else gamepass.id
+
+        # the same gamepass always lands on the same account unless one is given, keeping its revoke and purchase ordered
+        if account is None:
+            account = self.pinned(gamepass_id)
+
+        async def call(client: Roblox) -> None:
+            model = gamepass
+            # models act through the connection that fetched them, which may belong to another account
+            if isinstance(model, int) or getattr(model, 'connection', None) is not client.connection:
+                model = await client.get_gamepass(gamepass_id)
+
+            if action == 'purchase':
+                await client.queue_purchase(model)
+            else:
+                await client.queue_revoke(model)
+
+        await self.run(call, account=account)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'accounts': len(self.accounts),
+            'healthy': len(self.healthy),
+            'in_flight': sum(account.in_flight for account in self.accounts),
+            'requests': sum(account.requests for account in self.accounts),
+            'errors': sum(account.errors for account in self.accounts),
+            'retries': self.retries,
+            'evictions': self.evictions,
+            'per_account': [account.stats() for account in self.accounts],
+        }
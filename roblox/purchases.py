@@ -0,0 +1,210 @@
+"""
+MIT License
+
+Copyright (c) 2025 Gwarded
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, Literal, Optional, Tuple
+
+from .errors import PendingTransactionAlreadyExists, RobloxException
+
+if TYPE_CHECKING:
+    from . import abc
+
+    Action = Literal['purchase', 'revoke']
+
+__all__ = ('PurchaseQueue',)
+
+
+class _Intent:
+    __slots__ = ('action', 'gamepass', 'future', 'attempts')
+
+    def __init__(self, action: Action, gamepass: abc.Gamepass, future: asyncio.Future[None]):
+        self.action: Action = action
+        self.gamepass: abc.Gamepass = gamepass
+        self.future: asyncio.Future[None] = future
+        self.attempts: int = 0
+
+    @property
+    def key(self) -> Tuple[str, int]:
+        return self.action, self.gamepass.id
+
+
+class PurchaseQueue:
+    # one per account, purchases and revokes run one at a time in submission order
+
+    def __init__(self, *, pending_delay: float = 61.0, max_pending_retries: int = 5):
+        # how long a pending transaction blocks the account before it's worth trying again
+        self.pending_delay: float = pending_delay
+        self.max_pending_retries: int = max_pending_retries
+
+        self.submitted: int = 0
+        self.deduplicated: int = 0
+        self.completed: int = 0
+        self.failed: int = 0
+        self.rescheduled: int = 0
+
+        self._queue: Optional[asyncio.Queue[_Intent]] = None
+        self._worker: Optional[asyncio.Task[None]] = None
+        self._intents: Dict[Tuple[str, int], _Intent] = {}
+        # a pending transaction blocks every purchase on the account, so the whole queue waits out one timer
+        self._pause: Optional[asyncio.TimerHandle] = None
+        self._resumed: Optional[asyncio.Future[None]] = None
+
+    def __len__(self) -> int:
+        return len(self._intents)
+
+    def purchase(self, gamepass: abc.Gamepass) -> asyncio.Future[None]:
+        return self.submit('purchase', gamepass)
+
+    def revoke(self, gamepass: abc.Gamepass) -> asyncio.Future[None]:
+        return self.submit('revoke', gamepass)
+
+    def submit(self, action: Action, gamepass: abc.Gamepass) -> asyncio.Future[None]:
+        intent = self._intents.get((action, gamepass.id))
+
+        # an identical intent that hasn't finished yet covers this one too, each caller gets its own shield
+        # so that one giving up doesn't cancel the purchase for the others
+        if intent is not None:
+            self.deduplicated += 1
+            return asyncio.shield(intent.future)
+
+        intent = _Intent(action, gamepass, asyncio.get_running_loop().create_future())
+        self._intents[intent.key] = intent
+        self.submitted += 1
+
+        self._enqueue(intent)
+
+        return asyncio.shield(intent.future)
+
+    async def join(self) -> None:
+        while self._intents:
+            await asyncio.wait([intent.future for intent in self._intents.values()])
+
+    async def close(self) -> None:
+        worker = self._worker
+        self._worker = None
+
+        if worker is not None and not worker.done():
+            worker.cancel()
+
+            try:
+                await worker
+            except asyncio.CancelledError:
+                pass
+
+        if self._pause is not None:
+            self._pause.cancel()
+
+        for intent in self._intents.values():
+            intent.future.cancel()
+
+        self._queue = None
+        self._intents.clear()
+        self._pause = None
+        self._resumed = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'outstanding': len(self._intents),
+            'paused': self._pause is not None,
+            'submitted': self.submitted,
+            'deduplicated': self.deduplicated,
+            'completed': self.completed,
+            'failed': self.failed,
+            'rescheduled': self.rescheduled,
+        }
+
+    def _enqueue(self, intent: _Intent) -> None:
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.ensure_future(self._work(self._queue))
+
+        self._queue.put_nowait(intent)
+
+    async def _work(self, queue: asyncio.Queue[_Intent]) -> None:
+        while True:
+            intent = await queue.get()
+
+            # the intent that hit the pending transaction goes first once it clears, the rest keep their order behind it
+            while await self._run(intent):
+                assert self._resumed is not None
+                await self._resumed
+
+    async def _run(self, intent: _Intent) -> bool:
+        if intent.future.done():
+            # cancelled by close() while it was queued
+            self._intents.pop(intent.key, None)
+            return False
+
+        try:
+            if intent.action == 'purchase':
+                await intent.gamepass.purchase()
+            else:
+                await intent.gamepass.revoke()
+        except asyncio.CancelledError:
+            raise
+        except PendingTransactionAlreadyExists as exc:
+            if intent.attempts >= self.max_pending_retries:
+                self._finish(intent, exc)
+                return False
+
+            intent.attempts += 1
+            self.rescheduled += 1
+            loop = asyncio.get_running_loop()
+            self._resumed = loop.create_future()
+            self._pause = loop.call_later(self.pending_delay, self._resume)
+            return True
+        except (RobloxException, Exception) as exc:
+            self._finish(intent, exc)
+        else:
+            self._finish(intent, None)
+
+        return False
+
+    def _resume(self) -> None:
+        resumed = self._resumed
+        self._pause = None
+        self._resumed = None
+
+        if resumed is not None and not resumed.done():
+            resumed.set_result(None)
+
+    def _finish(self, intent: _Intent, exc: Optional[BaseException]) -> None:
+        self._intents.pop(intent.key, None)
+
+        if exc is None:
+            self.completed += 1
+        else:
+            self.failed += 1
+
+        if intent.future.done():
+            return
+
+        if exc is None:
+            intent.future.set_result(None)
+        else:
+            intent.future.set_exception(exc)
@@ -0,0 +1,175 @@
+"""
+MIT License
+
+Copyright (c) 2025 Gwarded
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Mapping, Optional
+
+__all__ = ('TokenBucket', 'RateLimiter')
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    # Retry-After may also be given as an HTTP date
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    __slots__ = ('rate', 'capacity', '_tokens', '_updated')
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+
+        self._tokens: float = self.capacity
+        self._updated: float = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def delay(self) -> float:
+        now = time.monotonic()
+        self._refill(now)
+
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+
+        return (1 - self._tokens) / self.rate
+
+
+class RateLimiter:
+    __slots__ = (
+        'buckets',
+        'max_retries',
+        'backoff_base',
+        'backoff_max',
+        'requests',
+        'waits',
+        'wait_time',
+        'rate_limited',
+        'retries',
+        '_blocked_until',
+    )
+
+    def __init__(
+        self,
+        buckets: Optional[Dict[str, TokenBucket]] = None,
+        *,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+    ):
+        # keyed on Route.module, modules without a bucket are only limited by the server
+        self.buckets: Dict[str, TokenBucket] = buckets or {}
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        self.requests: int = 0
+        self.waits: int = 0
+        self.wait_time: float = 0.0
+        self.rate_limited: int = 0
+        self.retries: int = 0
+
+        self._blocked_until: Dict[str, float] = {}
+
+    async def acquire(self, module: str) -> float:
+        waited = 0.0
+        bucket = self.buckets.get(module)
+
+        while True:
+            delay = self._blocked_until.get(module, 0.0) - time.monotonic()
+
+            if delay <= 0 and bucket is not None:
+                delay = bucket.delay()
+
+            if delay <= 0:
+                break
+
+            await asyncio.sleep(delay)
+            waited += delay
+
+        self.requests += 1
+        if waited:
+            self.waits += 1
+            self.wait_time += waited
+
+        return waited
+
+    def block(self, module: str, seconds: float) -> None:
+        until = time.monotonic() + seconds
+        if until > self._blocked_until.get(module, 0.0):
+            self._blocked_until[module] = until
+
+    def update(self, module: str, headers: Mapping[str, str]) -> None:
+        remaining = headers.get('x-ratelimit-remaining')
+
+        if remaining is None or remaining.strip() not in ('0', '0.0'):
+            return
+
+        reset = _parse_retry_after(headers.get('x-ratelimit-reset'))
+        if reset is not None:
+            self.block(module, reset)
+
+    def rate_limit(self, module: str, headers: Mapping[str, str], attempt: int) -> float:
+        self.rate_limited += 1
+
+        retry_after = _parse_retry_after(headers.get('retry-after'))
+        if retry_after is None:
+            retry_after = _parse_retry_after(headers.get('x-ratelimit-reset'))
+
+        if retry_after is not None:
+            delay = retry_after + random.uniform(0, self.backoff_base)
+        else:
+            cap = min(self.backoff_max, self.backoff_base * 2**attempt)
+            delay = cap / 2 + random.uniform(0, cap / 2)
+
+        self.block(module, delay)
+
+        return delay
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'requests': self.requests,
+            'waits': self.waits,
+            'wait_time': self.wait_time,
+            'rate_limited': self.rate_limited,
+            'retries': self.retries,
+        }
@@ -0,0 +1,343 @@
+"""
+MIT License
+
+Copyright (c) 2025 Gwarded
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import os
+import time
+from array import array
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from multiprocessing.managers import BaseManager
+from multiprocessing.util import Finalize
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Literal, Optional, Set, Tuple, Union
+
+import aiohttp
+
+from .client import Roblox
+from .errors import InternalServerError, NotFound, RobloxException, TooManyRequests
+
+if TYPE_CHECKING:
+    SweepKind = Literal['user', 'gamepass']
+
+__all__ = ('Sweep', 'RateCoordinator')
+
+# errors worth another attempt, anything else is written to the output as final
+_TRANSIENT = (TooManyRequests, InternalServerError, asyncio.TimeoutError, aiohttp.ClientError)
+
+
+class RateCoordinator:
+    # lives in a manager process and hands out a single request budget to every worker
+
+    def __init__(self, rate: float):
+        self.rate: float = rate
+        self._next: float = 0.0
+
+    def reserve(self, count: int) -> float:
+        # seconds until the reserved requests may start, spacing every process evenly over the shared rate
+        now = time.monotonic()
+        start = max(self._next, now)
+        self._next = start + count / self.rate
+
+        return start - now
+
+
+class _Manager(BaseManager):
+    pass
+
+
+_Manager.register('RateCoordinator', RateCoordinator)
+
+
+class _Budget:
+    __slots__ = ('coordinator', 'reserve', '_tokens', '_lock')
+
+    def __init__(self, coordinator: Any, reserve: int):
+        self.coordinator = coordinator
+        # requests taken from the coordinator per round trip
+        self.reserve = reserve
+        self._tokens: int = 0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            if self._tokens == 0:
+                loop = asyncio.get_running_loop()
+                delay = await loop.run_in_executor(None, self.coordinator.reserve, self.reserve)
+                self._tokens = self.reserve
+
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+            self._tokens -= 1
+
+
+class _Worker:
+    __slots__ = ('loop', 'client', 'budget', 'kind', 'concurrency', 'retries', 'retry_delay')
+
+    def __init__(
+        self,
+        kind: SweepKind,
+        concurrency: int,
+        retries: int,
+        retry_delay: float,
+        coordinator: Any,
+        reserve: int,
+        options: Dict[str, Any],
+    ):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+        self.kind: SweepKind = kind
+        self.concurrency: int = concurrency
+        self.retries: int = retries
+        self.retry_delay: float = retry_delay
+        self.client: Roblox = Roblox(**options)
+        self.budget: Optional[_Budget] = _Budget(coordinator, reserve) if coordinator is not None else None
+
+    def run(self, ids: array[int]) -> Tuple[List[str], int, int]:
+        return self.loop.run_until_complete(self._run(ids))
+
+    async def _run(self, ids: array[int]) -> Tuple[List[str], int, int]:
+        lines: List[str] = []
+        missing = 0
+        unfinished = 0
+        pending = iter(ids)
+
+        async def fetch() -> None:
+            nonlocal missing, unfinished
+
+            for id in pending:
+                try:
+                    model = await self._get(id)
+                except NotFound:
+                    missing += 1
+                    continue
+                except _TRANSIENT as exc:
+                    unfinished += 1
+                    lines.append(json.dumps({'id': id, 'error': type(exc).__name__, 'final': False}))
+                    continue
+                except (RobloxException, Exception) as exc:
+                    lines.append(json.dumps({'id': id, 'error': type(exc).__name__, 'final': True}))
+                    continue
+
+                lines.append(json.dumps({'id': id, 'data': model.data}))
+
+        await asyncio.gather(*(fetch() for _ in range(self.concurrency)))
+
+        return lines, missing, unfinished
+
+    async def _get(self, id: int) -> Any:
+        for attempt in itertools.count():
+            if self.budget is not None:
+                await self.budget.acquire()
+
+            try:
+                if self.kind == 'user':
+                    return await self.client.get_user(id)
+                return await self.client.get_gamepass(id)
+            except _TRANSIENT:
+                if attempt >= self.retries:
+                    raise
+
+            await asyncio.sleep(self.retry_delay * 2**attempt)
+
+    def close(self) -> None:
+        self.loop.run_until_complete(self.client.close())
+        self.loop.close()
+
+
+_worker: Optional[_Worker] = None
+
+
+def _init_worker(*args: Any) -> None:
+    global _worker
+
+    _worker = _Worker(*args)
+    # pool workers exit without running atexit hooks, multiprocessing finalizers still run
+    Finalize(None, _worker.close, exitpriority=10)
+
+
+def _run_shard(shard: int, ids: array[int]) -> Tuple[int, List[str], int, int]:
+    assert _worker is not None
+
+    return (shard, *_worker.run(ids))
+
+
+class Sweep:
+    # one event loop and one client per process, only finished shards are written to the checkpoint.
+    # error lines carry 'final': false when the id still failed with a transient error after every retry,
+    # such a shard is left out of the checkpoint so that running the sweep again fetches it once more
+
+    def __init__(
+        self,
+        ids: Union[Iterable[int], str, Path],
+        *,
+        kind: SweepKind = 'user',
+        output: Union[str, Path],
+        checkpoint: Optional[Union[str, Path]] = None,
+        workers: Optional[int] = None,
+        shard_size: int = 1000,
+        concurrency: int = 20,
+        retries: int = 3,
+        retry_delay: float = 1.0,
+        rate: Optional[float] = None,
+        reserve: int = 10,
+        **options: Any,
+    ):
+        # a path is read as one id per line
+        self.ids = ids
+        self.kind: SweepKind = kind
+        self.output = Path(output)
+        self.checkpoint: Optional[Path] = Path(checkpoint) if checkpoint is not None else None
+        self.workers: int = workers or os.cpu_count() or 1
+        self.shard_size: int = shard_size
+        self.concurrency: int = concurrency
+        # attempts per id after a rate limit, server error or timeout, backing off from retry_delay
+        self.retries: int = retries
+        self.retry_delay: float = retry_delay
+        # requests per second across every worker, None leaves it to each client's own rate limiter
+        self.rate: Optional[float] = rate
+        self.reserve: int = reserve
+        # passed to Roblox in every worker, so they must be picklable
+        self.options: Dict[str, Any] = {'model_mode': 'lazy', **options}
+
+        self.completed: int = 0
+        self.skipped: int = 0
+        self.written: int = 0
+        self.missing: int = 0
+        self.unfinished: int = 0
+
+    def _iter_ids(self) -> Iterator[int]:
+        if isinstance(self.ids, (str, Path)):
+            with open(self.ids, encoding='utf-8') as file:
+                for line in file:
+                    line = line.strip()
+                    if line:
+                        yield int(line)
+        else:
+            yield from self.ids
+
+    def _iter_shards(self) -> Iterator[Tuple[int, array[int]]]:
+        ids = self._iter_ids()
+
+        for shard in itertools.count():
+            chunk = array('q', itertools.islice(ids, self.shard_size))
+            if not chunk:
+                return
+            yield shard, chunk
+
+    def _finished_shards(self) -> Set[int]:
+        if self.checkpoint is None or not self.checkpoint.exists():
+            return set()
+
+        with self.checkpoint.open(encoding='utf-8') as file:
+            return {int(line) for line in file if line.strip()}
+
+    def run(self) -> Dict[str, Any]:
+        finished = self._finished_shards()
+        start = time.perf_counter()
+
+        manager: Optional[_Manager] = None
+        coordinator = None
+
+        if self.rate is not None:
+            manager = _Manager()
+            manager.start()
+            coordinator = manager.RateCoordinator(self.rate)  # type: ignore
+
+        executor = ProcessPoolExecutor(
+            self.workers,
+            initializer=_init_worker,
+            initargs=(
+                self.kind,
+                self.concurrency,
+                self.retries,
+                self.retry_delay,
+                coordinator,
+                self.reserve,
+                self.options,
+            ),
+        )
+
+        output = self.output.open('a', encoding='utf-8')
+        checkpoint = self.checkpoint.open('a', encoding='utf-8') if self.checkpoint is not None else None
+
+        try:
+            shards = (item for item in self._iter_shards() if not self._skip(item[0], finished))
+            running: Set[Future[Tuple[int, List[str], int, int]]] = set()
+
+            # a couple of shards per worker in flight keeps every process busy without loading the whole input
+            for shard, ids in itertools.islice(shards, self.workers * 2):
+                running.add(executor.submit(_run_shard, shard, ids))
+
+            while running:
+                done, running = wait(running, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    self._write(output, checkpoint, *future.result())
+
+                    for shard, ids in itertools.islice(shards, 1):
+                        running.add(executor.submit(_run_shard, shard, ids))
+        finally:
+            executor.shutdown(cancel_futures=True)
+            output.close()
+
+            if checkpoint is not None:
+                checkpoint.close()
+            if manager is not None:
+                manager.shutdown()
+
+        return {
+            'completed': self.completed,
+            'skipped': self.skipped,
+            'written': self.written,
+            'missing': self.missing,
+            'unfinished': self.unfinished,
+            'elapsed': time.perf_counter() - start,
+        }
+
+    def _skip(self, shard: int, finished: Set[int]) -> bool:
+        if shard in finished:
+            self.skipped += 1
+            return True
+        return False
+
+    def _write(self, output: Any, checkpoint: Any, shard: int, lines: List[str], missing: int, unfinished: int) -> None:
+        if lines:
+            output.write('\n'.join(lines) + '\n')
+        output.flush()
+
+        # results are on disk before the shard is marked as done, a resumed run may repeat a shard but never loses one
+        if checkpoint is not None and not unfinished:
+            checkpoint.write(f'{shard}\n')
+            checkpoint.flush()
+
+        self.completed += 1
+        self.written += len(lines)
+        self.missing += missing
+        self.unfinished += unfinished
@@ -0,0 +1,248 @@
+"""
+MIT License
+
+Copyright (c) 2025 Gwarded
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Iterable, Mapping, Optional, Tuple
+
+import aiohttp
+from multidict import CIMultiDict, CIMultiDictProxy
+
+__all__ = ('TransportConfig', 'Response', 'Transport', 'AiohttpTransport')
+
+
+class TransportConfig:
+    __slots__ = (
+        'limit',
+        'limit_per_host',
+        'keepalive_timeout',
+        'ttl_dns_cache',
+        'connect_timeout',
+        'read_timeout',
+        'total_timeout',
+        'chunk_size',
+    )
+
+    def __init__(
+        self,
+        *,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = 15.0,
+        ttl_dns_cache: Optional[int] = 300,
+        connect_timeout: Optional[float] = 10.0,
+        read_timeout: Optional[float] = 30.0,
+        total_timeout: Optional[float] = 60.0,
+        chunk_size: int = 16384,
+    ):
+        # 0 means no limit for both connection limits, same as aiohttp
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.ttl_dns_cache = ttl_dns_cache
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.total_timeout = total_timeout
+        # bytes read at a time from streamed responses
+        self.chunk_size = chunk_size
+
+    def connector(self) -> aiohttp.TCPConnector:
+        return aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.ttl_dns_cache,
+            use_dns_cache=self.ttl_dns_cache is not None,
+        )
+
+    def timeout(self) -> aiohttp.ClientTimeout:
+        return aiohttp.ClientTimeout(
+            total=self.total_timeout,
+            sock_connect=self.connect_timeout,
+            sock_read=self.read_timeout,
+        )
+
+    def session(self, **kwargs: Any) -> aiohttp.ClientSession:
+        return aiohttp.ClientSession(connector=self.connector(), timeout=self.timeout(), **kwargs)
+
+
+class Response:
+    __slots__ = ('status', 'headers', 'body', 'content_type', 'charset')
+
+    def __init__(
+        self,
+        status: int,
+        body: bytes = b'',
+        headers: Optional[Mapping[str, str]] = None,
+        *,
+        content_type: Optional[str] = None,
+        charset: Optional[str] = None,
+    ):
+        self.status: int = status
+        self.body: bytes = body
+
+        if not isinstance(headers, CIMultiDictProxy):
+            headers = CIMultiDictProxy(CIMultiDict(headers or {}))
+        self.headers: CIMultiDictProxy[str] = headers
+
+        if content_type is None:
+            content_type, _, options = headers.get('Content-Type', 'application/octet-stream').partition(';')
+            content_type = content_type.strip().lower()
+
+            if charset is None and 'charset=' in options:
+                charset = options.split('charset=', 1)[1].split(';', 1)[0].strip().strip('"')
+
+        self.content_type: str = content_type
+        self.charset: Optional[str] = charset
+
+    def text(self) -> str:
+        return self.body.decode(self.charset or 'utf-8')
+
+
+class Transport:
+    # sends requests for Http, subclass it to serve responses without touching the network
+
+    async def start(self) -> None:
+        pass
+
+    async def warm_up(self, urls: Iterable[str], headers: Dict[str, str]) -> None:
+        pass
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Dict[str, str],
+        json: Any = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Response:
+        raise NotImplementedError
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Dict[str, str],
+        params: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[Tuple[Response, AsyncIterator[bytes]]]:
+        # transports that can't stream hand out the whole body as a single chunk
+        response = await self.request(method, url, headers=headers, params=params)
+
+        async def chunks() -> AsyncIterator[bytes]:
+            yield response.body
+
+        yield response, chunks()
+
+    async def close(self) -> None:
+        pass
+
+
+class AiohttpTransport(Transport):
+
+    def __init__(self, config: Optional[TransportConfig] = None, *, session: Optional[aiohttp.ClientSession] = None):
+        self.config: TransportConfig = config if config is not None else TransportConfig()
+
+        # an externally owned session may be shared between clients, so it is never closed or mutated here
+        self._owns_session: bool = session is None
+        # created lazily so the client can be built outside of a running event loop
+        self.session: Optional[aiohttp.ClientSession] = session
+
+    async def start(self) -> None:
+        if self.session is None:
+            self.session = self.config.session()
+
+    async def warm_up(self, urls: Iterable[str], headers: Dict[str, str]) -> None:
+        await self.start()
+        await asyncio.gather(*(self._warm_up(url, headers) for url in urls))
+
+    async def _warm_up(self, url: str, headers: Dict[str, str]) -> None:
+        assert self.session is not None
+
+        # any response will do, the point is to have an open connection in the pool afterwards
+        try:
+            async with self.session.head(url, headers=headers, allow_redirects=False):
+                pass
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            pass
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Dict[str, str],
+        json: Any = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Response:
+        if self.session is None:
+            await self.start()
+            assert self.session is not None
+
+        async with self.session.request(method, url, json=json, params=params, headers=headers) as response:
+            body = await response.read()
+
+        return Response(
+            response.status,
+            body,
+            response.headers,
+            content_type=response.content_type,
+            charset=response.charset,
+        )
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Dict[str, str],
+        params: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[Tuple[Response, AsyncIterator[bytes]]]:
+        if self.session is None:
+            await self.start()
+            assert self.session is not None
+
+        async with self.session.request(method, url, params=params, headers=headers) as response:
+            # the body is left unread, it is consumed through the chunks
+            head = Response(
+                response.status,
+                b'',
+                response.headers,
+                content_type=response.content_type,
+                charset=response.charset,
+            )
+            yield head, response.content.iter_chunked(self.config.chunk_size)
+
+    async def close(self) -> None:
+        if self.session is None:
+            return
+
+        if self._owns_session:
+            await self.session.close()
+        self.session = None
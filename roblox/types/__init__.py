@@ -4,6 +4,6 @@
 """
 
 from .gamepass import Gamepass, PartialGamepass
-from .user import Creator, CreatorType, PartialUser, User
+from .user import Creator, CreatorType, PartialUser, RequestedUser, User
 
-__all__ = ('Gamepass', 'Creator', 'CreatorType', 'PartialUser', 'User', 'PartialGamepass')
+__all__ = ('Gamepass', 'Creator', 'CreatorType', 'PartialUser', 'RequestedUser', 'User', 'PartialGamepass')
@@ -26,7 +26,7 @@ from __future__ import annotations
 
 from typing import Literal, Optional, TypedDict
 
-__all__ = ('PartialUser', 'User', 'CreatorType', 'Creator')
+__all__ = ('PartialUser', 'RequestedUser', 'User', 'CreatorType', 'Creator')
 
 
 class PartialUser(TypedDict):
@@ -36,6 +36,10 @@ class PartialUser(TypedDict):
     name: str
 
 
+class RequestedUser(PartialUser):
+    requestedUsername: str
+
+
 class User(PartialUser):
     created: str
     description: str
@@ -27,6 +27,8 @@ from __future__ import annotations
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
+from .utils import _payload_field, parse_time
+
 if TYPE_CHECKING:
     from .http import Connection
     from .types.user import Creator as CreatorPayload
@@ -35,7 +37,7 @@ if TYPE_CHECKING:
     from .types.user import User as UserPayload
 
 
-__all__ = ('PartialUser', 'User')
+__all__ = ('PartialUser', 'User', 'LazyUser')
 
 
 class PartialUser:
@@ -62,7 +64,26 @@ class PartialUser:
         return f'{self.name}'
 
 
-class User:
+class _BaseUser:
+    # filled on the first access of created
+    __slots__ = ('_created',)
+
+    if TYPE_CHECKING:
+        _created: Optional[datetime]
+        raw_created: str
+        name: str
+
+    def __str__(self) -> str:
+        return f'{self.name}'
+
+    @property
+    def created(self) -> datetime:
+        if self._created is None:
+            self._created = parse_time(self.raw_created)
+        return self._created
+
+
+class User(_BaseUser):
     __slots__ = (
         'connection',
         'data',
@@ -79,9 +100,9 @@ class User:
     if TYPE_CHECKING:
         connection: Connection
 
-        data: UserPayload
+        data: Optional[UserPayload]
 
-        raw_created_time: str
+        raw_created: str
         description: str
         display_name: str
         external_app_display_name: Optional[str]
@@ -90,11 +111,13 @@ class User:
         is_banned: bool
         name: str
 
-    def __init__(self, connection: Connection, data: UserPayload):
+    def __init__(self, connection: Connection, data: UserPayload, *, retain_payload: bool = True):
         self.connection = connection
 
-        self.data = data
+        self.data = data if retain_payload else None
+        self._created = None
 
+        self.raw_created = data.get('created')
         self.description = data.get('description')
         self.display_name = data.get('displayName')
         self.external_app_display_name = data.get('externalAppDisplayName')
@@ -103,12 +126,29 @@ class User:
         self.is_banned = data.get('isBanned')
         self.name = data.get('name')
 
-    def __str__(self) -> str:
-        return f'{self.name}'
 
-    @property
-    def created(self) -> datetime:
-        return datetime.fromisoformat(self.data.get('created').replace('Z', '+00:00'))
+class LazyUser(_BaseUser):
+    __slots__ = ('connection', 'data')
+
+    if TYPE_CHECKING:
+        connection: Connection
+
+        data: UserPayload
+
+    raw_created: str = _payload_field('created')
+    description: str = _payload_field('description')
+    display_name: str = _payload_field('displayName')
+    external_app_display_name: Optional[str] = _payload_field('externalAppDisplayName')
+    has_verified_badge: Optional[bool] = _payload_field('hasVerifiedBadge')
+    id: int = _payload_field('id')
+    is_banned: bool = _payload_field('isBanned')
+    name: str = _payload_field('name')
+
+    def __init__(self, connection: Connection, data: UserPayload):
+        self.connection = connection
+
+        self.data = data
+        self._created = None
 
 
 class Creator:
@@ -0,0 +1,228 @@
+"""
+MIT License
+
+Copyright (c) 2025 Gwarded
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+from array import array
+from datetime import datetime, timedelta, timezone
+from operator import attrgetter
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, List, Optional, Sequence, Tuple, TypeVar, Union
+
+try:
+    import orjson  # type: ignore
+except ModuleNotFoundError:
+    HAS_ORJSON = False
+else:
+    HAS_ORJSON = True
+
+try:
+    import msgspec  # type: ignore
+except ModuleNotFoundError:
+    HAS_MSGSPEC = False
+else:
+    HAS_MSGSPEC = True
+
+
+__all__ = (
+    'parse_time',
+    'timestamps',
+    'sort_by_time',
+)
+
+T = TypeVar('T')
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+if HAS_ORJSON:
+    _from_json = orjson.loads  # type: ignore
+
+elif HAS_MSGSPEC:
+    _msgspec_decoder = msgspec.json.Decoder()  # type: ignore
+
+    def _from_json(obj: Union[str, bytes]) -> Any:  # type: ignore
+        return _msgspec_decoder.decode(obj)
+
+else:
+
+    def _from_json(obj: Union[str, bytes]) -> Any:  # type: ignore
+        return json.loads(obj)
+
+
+class _PayloadField:
+    __slots__ = ('key',)
+
+    def __init__(self, key: str):
+        self.key = key
+
+    def __get__(self, instance: Any, owner: Any) -> Any:
+        if instance is None:
+            return self
+
+        return instance.data.get(self.key)
+
+
+def _payload_field(key: str) -> Any:
+    # read-only attribute that is looked up in the instance's payload on access
+    return _PayloadField(key)
+
+
+_JSON_DECODER = json.JSONDecoder()
+_JSON_WHITESPACE = ' \t\n\r'
+_JSON_SEPARATORS = ' \t\n\r,'
+
+
+def _skip_json(buffer: str, position: int, characters: str = _JSON_WHITESPACE) -> int:
+    while position < len(buffer) and buffer[position] in characters:
+        position += 1
+
+    return position
+
+
+def _find_json_array(buffer: str, position: int, key: str) -> Tuple[int, Optional[bool]]:
+    # walks the members of the top level object starting at position, which is past the opening brace.
+    # returns where to resume and True once the array under key opens there, False if the object has no
+    # such array or None while more data is needed. nested objects are skipped whole, so only top level keys match
+    while True:
+        start = _skip_json(buffer, position, _JSON_SEPARATORS)
+
+        if start >= len(buffer):
+            return position, None
+
+        if buffer[start] == '}':
+            return start, False
+
+        try:
+            name, end = _JSON_DECODER.raw_decode(buffer, start)
+        except ValueError:
+            return position, None
+
+        end = _skip_json(buffer, end)
+        if end >= len(buffer):
+            return position, None
+
+        if buffer[end] != ':':
+            raise ValueError(f'Malformed JSON object at {name!r}')
+
+        end = _skip_json(buffer, end + 1)
+        if end >= len(buffer):
+            return position, None
+
+        if name == key:
+            return (end + 1, True) if buffer[end] == '[' else (end, False)
+
+        try:
+            _, end = _JSON_DECODER.raw_decode(buffer, end)
+        except ValueError:
+            return position, None
+
+        # only the following separator proves a value is complete, a number may have more digits coming
+        end = _skip_json(buffer, end)
+        if end >= len(buffer) or buffer[end] not in ',}':
+            return position, None
+
+        position = end
+
+
+async def _iter_json_array(chunks: AsyncIterable[bytes], key: str) -> AsyncIterator[Any]:
+    # decodes the elements of the array under a top level key as they arrive, only a single element is buffered at a time
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    buffer = ''
+    position = 0
+    opened = False
+    found: Optional[bool] = None
+
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+
+        if not opened:
+            position = _skip_json(buffer, position)
+            if position >= len(buffer):
+                continue
+
+            if buffer[position] != '{':
+                raise ValueError('Expected a JSON object')
+
+            opened = True
+            position += 1
+
+        if found is None:
+            position, found = _find_json_array(buffer, position, key)
+
+            if found is False:
+                return
+
+            if found is None:
+                buffer = buffer[position:]
+                position = 0
+                continue
+
+        while True:
+            start = _skip_json(buffer, position, _JSON_SEPARATORS)
+
+            if start >= len(buffer):
+                break
+
+            if buffer[start] == ']':
+                return
+
+            try:
+                item, end = _JSON_DECODER.raw_decode(buffer, start)
+            except ValueError:
+                # the element continues in the next chunk
+                break
+
+            # a chunk may end inside a number, e.g. '1.' of '1.5e3', which still decodes, wait for the separator
+            end = _skip_json(buffer, end)
+            if end >= len(buffer) or buffer[end] not in ',]':
+                break
+
+            yield item
+            position = end
+
+        buffer = buffer[position:]
+        position = 0
+
+    if opened:
+        raise ValueError(f'Truncated JSON array {key!r}')
+
+
+def parse_time(timestamp: str) -> datetime:
+    return datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+
+
+def timestamps(models: Iterable[Any], attribute: str = 'created') -> array[int]:
+    # microseconds since the epoch, parsed once per model through its memoized property
+    get = attrgetter(attribute)
+    return array('q', [(get(model) - _EPOCH) // _MICROSECOND for model in models])
+
+
+def sort_by_time(models: Iterable[T], attribute: str = 'created', *, reverse: bool = False) -> List[T]:
+    models = models if isinstance(models, Sequence) else list(models)
+    keys = timestamps(models, attribute)
+
+    return [models[index] for index in sorted(range(len(keys)), key=keys.__getitem__, reverse=reverse)]
@@ -0,0 +1,21 @@
+import asyncio
+
+import pytest
+
+from roblox import Cache, DiskCache, RobloxPool
+
+
+def test_close_waits_for_queued_writes(tmp_path):
+    async def run():
+        disk = DiskCache(tmp_path / 'cache.db')
+        writes = [disk.run(disk.set, 'user', id, b'{}') for id in range(50)]
+        await disk.close()
+        assert all(write.done() for write in writes)
+
+    asyncio.run(run())
+    assert len(DiskCache(tmp_path / 'cache.db')) == 50
+
+
+def test_pool_rejects_shared_cache():
+    with pytest.raises(TypeError):
+        RobloxPool(['a', 'b'], cache=Cache())
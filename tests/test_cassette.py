@@ -0,0 +1,50 @@
+import asyncio
+import json
+
+from roblox.cassette import RecordingTransport, ReplayTransport
+from roblox.http import Http, Route
+from roblox.transport import Response, Transport
+
+ROUTE = Route('POST', 'apis', '/game-passes/v1/game-passes/{product_id}/purchase', product_id=1)
+
+
+class Challenge(Transport):
+    # answers POSTs without a token with a 403 token challenge, like the real API
+
+    def __init__(self):
+        self.requests = []
+
+    async def request(self, method, url, *, headers, json=None, params=None):
+        self.requests.append(headers.get('X-CSRF-TOKEN'))
+        if 'X-CSRF-TOKEN' not in headers:
+            headers = {'x-csrf-token': 'secret', 'set-cookie': 'session', 'content-type': 'application/json'}
+            return Response(403, b'{}', headers)
+        return Response(200, b'{"purchased": true}', {'content-type': 'application/json'})
+
+
+def purchase(transport):
+    async def run():
+        http = Http(authorization='cookie', transport=transport)
+        try:
+            return await http.request(ROUTE, data={'expectedPrice': 10})
+        finally:
+            await http.close()
+
+    return asyncio.run(run())
+
+
+def test_post_round_trip(tmp_path):
+    path = tmp_path / 'cassette.ndjson'
+    server = Challenge()
+
+    assert purchase(RecordingTransport(server, path)) == ({'purchased': True}, 200)
+    assert server.requests == [None, 'secret']
+
+    entries = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [entry['status'] for entry in entries] == [403, 200]
+    assert entries[0]['headers'] == {'x-csrf-token': 'REDACTED', 'content-type': 'application/json'}
+    assert 'secret' not in path.read_text()
+
+    replay = ReplayTransport(path)
+    assert purchase(replay) == ({'purchased': True}, 200)
+    assert (replay.served, replay.missed) == (2, 0)
@@ -0,0 +1,85 @@
+import asyncio
+
+import pytest
+
+from roblox.http import Connection, Route
+
+
+def test_route_formats_parameters():
+    path = '/v1/users/{user_id}/items/{item_type}/{item_id}'
+    route = Route('GET', 'inventory', path, user_id=1, item_type='a b', item_id=2)
+    assert route.formatted_path == '/v1/users/1/items/a%20b/2'
+    assert route.url == 'https://inventory.roblox.com/v1/users/1/items/a%20b/2'
+    assert Route('GET', 'users', '/v1/users/{user_id}%', user_id=3).formatted_path == '/v1/users/3%'
+    assert Route('GET', 'users', '/v1/users/authenticated').url == 'https://users.roblox.com/v1/users/authenticated'
+
+
+class Ownership(Connection):
+    def __init__(self):
+        super().__init__()
+        self.checked = []
+
+    async def get_user_gamepass_ownership(self, user_id, gamepass_id):
+        self.checked.append((user_id, gamepass_id))
+        await asyncio.sleep(0)
+        return (user_id + gamepass_id) % 2 == 0
+
+
+def check(pairs, **options):
+    async def run():
+        connection = Ownership()
+        try:
+            return await asyncio.wait_for(connection.check_ownership(pairs, **options), 5)
+        finally:
+            await connection.close()
+
+    return asyncio.run(run())
+
+
+def test_check_ownership():
+    assert check([(1, 1), (1, 2), (2, 2)], concurrency=2) == {(1, 1): True, (1, 2): False, (2, 2): True}
+
+
+def test_malformed_pair_is_raised():
+    with pytest.raises(ValueError):
+        check([(1, 2), (3,)])
+
+
+def test_failing_iterable_is_raised():
+    def pairs():
+        yield 1, 2
+        raise RuntimeError('broken input')
+
+    with pytest.raises(RuntimeError, match='broken input'):
+        check(pairs(), concurrency=3)
+
+
+class Inventory(Ownership):
+    def __init__(self, inventory):
+        super().__init__()
+        self.inventory = inventory
+        self.listed = []
+
+    async def iter_user_gamepasses(self, id, **options):
+        self.listed.append(id)
+        for gamepass_id in self.inventory.get(id, ()):
+            yield type('Gamepass', (), {'id': gamepass_id})
+
+
+def test_users_with_many_pairs_are_read_from_their_inventory():
+    async def run():
+        connection = Inventory({1: [10, 12, 14]})
+        pairs = [(1, gamepass_id) for gamepass_id in range(10, 16)] + [(2, 10)]
+
+        try:
+            result = await connection.check_ownership(pairs, group_threshold=5)
+        finally:
+            await connection.close()
+
+        return connection, result
+
+    connection, result = asyncio.run(run())
+
+    assert connection.listed == [1]
+    assert connection.checked == [(2, 10)]
+    assert result == {**{(1, gamepass_id): gamepass_id in (10, 12, 14) for gamepass_id in range(10, 16)}, (2, 10): True}
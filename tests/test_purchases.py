@@ -0,0 +1,52 @@
+import asyncio
+import time
+
+from roblox import PurchaseQueue
+from roblox.errors import PendingTransactionAlreadyExists
+
+
+class Account:
+    # every purchase leaves the whole account pending for a while, like the real API
+
+    def __init__(self, window):
+        self.window = window
+        self.pending_until = 0.0
+        self.purchased = []
+
+    def gamepass(self, id):
+        return Gamepass(self, id)
+
+
+class Gamepass:
+    def __init__(self, account, id):
+        self.account = account
+        self.id = id
+
+    async def purchase(self):
+        await asyncio.sleep(0)
+        account = self.account
+        if time.monotonic() < account.pending_until:
+            raise PendingTransactionAlreadyExists()
+
+        account.purchased.append(self.id)
+        account.pending_until = time.monotonic() + account.window
+
+
+def test_pending_transaction_pauses_the_whole_queue():
+    account = Account(0.02)
+
+    async def run():
+        queue = PurchaseQueue(pending_delay=0.03, max_pending_retries=5)
+        try:
+            futures = [queue.purchase(account.gamepass(id)) for id in range(10)]
+            results = await asyncio.wait_for(asyncio.gather(*futures, return_exceptions=True), 5)
+            return results, queue.stats()
+        finally:
+            await queue.close()
+
+    results, stats = asyncio.run(run())
+
+    assert results == [None] * 10
+    assert account.purchased == list(range(10))
+    assert stats['failed'] == 0
+    assert stats['rescheduled'] == 9
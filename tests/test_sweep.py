@@ -0,0 +1,61 @@
+import json
+
+from roblox import Sweep
+from roblox.transport import Response, Transport
+
+
+def user(id):
+    payload = {
+        'id': id,
+        'name': f'user{id}',
+        'displayName': f'User{id}',
+        'hasVerifiedBadge': False,
+        'description': '',
+        'created': '2020-01-02T03:04:05.123Z',
+        'isBanned': False,
+        'externalAppDisplayName': None,
+    }
+    return json.dumps(payload).encode()
+
+
+class Flaky(Transport):
+    # user 2 fails twice before answering, user 3 never answers and user 4 doesn't exist
+
+    def __init__(self):
+        self.calls = {}
+
+    async def request(self, method, url, *, headers, json=None, params=None):
+        id = int(url.rsplit('/', 1)[1])
+        calls = self.calls[id] = self.calls.get(id, 0) + 1
+        headers = {'content-type': 'application/json'}
+
+        if id == 3 or (id == 2 and calls <= 2):
+            return Response(500, b'{}', headers)
+        if id == 4:
+            return Response(404, b'{"errors": [{"code": 3, "message": "The user id is invalid."}]}', headers)
+        return Response(200, user(id), headers)
+
+
+def test_transient_errors_are_retried_and_not_checkpointed(tmp_path):
+    output = tmp_path / 'users.ndjson'
+    checkpoint = tmp_path / 'users.checkpoint'
+
+    sweep = Sweep(
+        [1, 2, 3, 4, 5, 6],
+        output=output,
+        checkpoint=checkpoint,
+        workers=1,
+        shard_size=3,
+        retry_delay=0,
+        transport=Flaky(),
+    )
+    stats = sweep.run()
+
+    lines = {line['id']: line for line in map(json.loads, output.read_text().splitlines())}
+    assert sorted(lines) == [1, 2, 3, 5, 6]
+    assert lines[2]['data']['name'] == 'user2'
+    assert lines[3] == {'id': 3, 'error': 'InternalServerError', 'final': False}
+    assert (stats['missing'], stats['unfinished']) == (1, 1)
+
+    # the shard holding user 3 runs again on the next sweep
+    assert checkpoint.read_text().split() == ['1']
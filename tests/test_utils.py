@@ -0,0 +1,55 @@
+import asyncio
+import json
+
+import pytest
+
+from roblox.utils import _iter_json_array
+
+DOCUMENTS = [
+    '{"gamePasses":[1.5e3,true,null]}',
+    '{"gamePasses": [ -12 , 0.25 , 3E-2 , "a,]b" , [1, [2]] , {"x": "}"} ] , "nextPageCursor": null}',
+    '{"prev":{"gamePasses":[5,6]},"gamePasses":[1]}',
+    '{"note":"\\"gamePasses\\":[9]","gamePasses":[{"gamePassId":1,"name":"é中\U0001f600"}]}',
+    '{"count": 12345, "gamePasses": []}',
+    '{"gamePasses":[{"gamePassId":1,"price":100},{"gamePassId":2,"price":250.5}],"data":[7]}',
+]
+
+
+def collect(document: bytes, size: int, key: str = 'gamePasses') -> list:
+    async def chunks():
+        for start in range(0, len(document), size):
+            yield document[start : start + size]
+
+    async def run():
+        return [item async for item in _iter_json_array(chunks(), key)]
+
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize('document', DOCUMENTS)
+def test_every_chunk_boundary(document):
+    encoded = document.encode()
+    expected = json.loads(document)['gamePasses']
+
+    for size in range(1, len(encoded) + 1):
+        assert collect(encoded, size) == expected, size
+
+
+def test_only_top_level_keys_match():
+    assert collect(b'{"prev":{"gamePasses":[5,6]},"gamePasses":[1]}', 1) == [1]
+    assert collect(b'{"prev":{"gamePasses":[5,6]}}', 1) == []
+
+
+def test_other_key():
+    assert collect(DOCUMENTS[5].encode(), 3, key='data') == [7]
+
+
+def test_missing_or_null_array():
+    assert collect(b'{"errors": [{"code": 0}]}', 2) == []
+    assert collect(b'{"gamePasses": null}', 2) == []
+
+
+@pytest.mark.parametrize('document', [b'{"gamePasses":[1,2', b'{"gamePasses":[1.5', b'{"prev":{"a":1}'])
+def test_truncated(document):
+    with pytest.raises(ValueError):
+        collect(document, 1)